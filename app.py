@@ -1,11 +1,11 @@
 """Primary application class for PushIt."""
 
 import sys
-import json
 import os
 import platform
+import queue
+import threading
 import time
-import traceback
 
 # Patch engineio Payload to increase max_decode_packets limit
 # This fixes "Too many packets in payload" error when browser sends many messages
@@ -27,7 +27,7 @@ import push2_python
 
 import definitions
 from clip import Clip
-from utils import show_notification
+from utils import render_notification, json_dumps, json_loads, MARQUEE_STATE
 from metronome import AhPushItMetronome
 from modes.add_track_mode import AddTrackMode
 from modes.clip_edit_mode import ClipEditMode
@@ -46,8 +46,29 @@ from session import Session
 from sequencer import Sequencer
 from project_manager import ProjectManager
 
-buttons_pressed_state = {}
-pads_pressed_state = {}  # Track pad press times for long press detection
+# Button pressed state as a bitmap indexed by BUTTON_INDEX (the set of Push2
+# button names is fixed, so map each to an integer once at import)
+BUTTON_INDEX = {
+    name: i
+    for i, name in enumerate(
+        sorted(
+            {
+                value
+                for key, value in vars(push2_python.constants).items()
+                if key.startswith("BUTTON_") and isinstance(value, str)
+            }
+        )
+    )
+}
+buttons_pressed_state = bytearray(len(BUTTON_INDEX))
+# Track pad press times for long press detection, indexed by pad_n (a MIDI note
+# number). Preallocated so pad events do not allocate; 0.0 means not pressed
+pads_press_time = [0.0] * 128
+pads_handled = bytearray(128)
+# The PushItApp instance, created when running app.py. Push event handlers can
+# fire before it exists, so they return early while it is None
+app = None
+
 # Track encoder touch state for tap detection
 encoder_touch_state = {}
 
@@ -73,6 +94,33 @@ ENCODER_ACCEL_PROFILES = {
 }
 DEFAULT_ENCODER_ACCEL_PROFILE = "fast"
 
+# Mode methods that PushItApp keeps precomputed lists of (see _rebuild_active_mode_caches).
+# Input hooks are dispatched to the most recently activated mode first
+MODE_INPUT_HOOKS = (
+    "on_encoder_rotated",
+    "on_button_pressed",
+    "on_button_released",
+    "on_pad_pressed",
+    "on_pad_released",
+    "on_pad_long_pressed",
+    "on_pad_aftertouch",
+    "on_touchstrip",
+    "on_sustain_pedal",
+)
+MODE_UPDATE_HOOKS = (
+    "update_pads",
+    "update_buttons",
+    "update_display",
+    "check_for_delayed_actions",
+)
+
+# Intervals (seconds) at which the slow-changing checks in
+# check_for_delayed_actions are run, instead of on every frame
+DELAYED_ACTIONS_INTERVALS = {
+    "midi_devices": 5.0,
+    "midi_configured": 1.0,
+}
+
 
 def compute_accelerated_increment(encoder_name, increment, profile=DEFAULT_ENCODER_ACCEL_PROFILE, now=None):
     """Compute the effective (accelerated) increment for an encoder rotation.
@@ -93,7 +141,7 @@ def compute_accelerated_increment(encoder_name, increment, profile=DEFAULT_ENCOD
         return increment
 
     if now is None:
-        now = time.time()
+        now = time.monotonic()
 
     mag = abs(increment)
     if mag == 0:
@@ -162,14 +210,28 @@ class PushItApp(object):
     current_frame_rate_measurement_second = 0
 
     # other state vars
-    active_modes = []
+    # active_modes is a dict used as an insertion-ordered set (values are unused),
+    # _active_by_xor maps each xor_group to the list of active modes in it
+    active_modes = {}
+    _active_by_xor = {}
+    _active_modes_reversed = ()
+    _mode_hooks = {hook: () for hook in MODE_INPUT_HOOKS + MODE_UPDATE_HOOKS}
+
+    # Last colors sent to the Push buttons/pads (see set_button_color and set_pads_color)
+    _button_color_cache = {}
+    _pads_color_cache = None
+    _all_modes = ()
     previously_active_mode_for_xor_group = {}
     pads_need_update = True
     buttons_need_update = True
+    display_needs_update = True
+    _last_display_update_time = 0
 
     # notifications
     notification_text = None
+    _notification_surface = None  # notification_text pre-rendered by render_notification
     notification_time = 0
+    _notification_expires_at = 0
 
     # fixing issue with 2 alternating channel pressure values
     last_cp_value_recevied = 0
@@ -192,10 +254,16 @@ class PushItApp(object):
         self.settings_file = os.path.join(self.settings_dir, "settings.json")
 
         if os.path.exists(self.settings_file):
-            self.settings = json.load(open(self.settings_file))
+            with open(self.settings_file) as f:
+                self.settings = json_loads(f.read())
         else:
             self.settings = {}
 
+        # Settings are written to disk by a background thread so a slow write
+        # (e.g. on the Raspberry Pi SD card) does not stall the UI loop
+        self._settings_write_queue = queue.Queue()
+        threading.Thread(target=self._settings_writer, daemon=True).start()
+
         # initialize timeline in app
         # to make access from session and sequencer simpler
         self.global_timeline = iso.Timeline()
@@ -205,7 +273,18 @@ class PushItApp(object):
 
         self.target_frame_rate = self.settings.get("target_frame_rate", 60)
         self.use_push2_display = self.settings.get("use_push2_display", True)
-        self._last_midi_check_time = 0  # Initialize MIDI check timer
+        # MIDI device scans run in a worker thread: it takes scan jobs from _midi_scan_jobs and
+        # posts their results to _midi_scan_results, which the main loop merges into the session.
+        # It is started here, before run_loop raises the main thread to realtime priority, so the
+        # slow port enumeration does not inherit that scheduling policy
+        self._midi_scan_jobs = queue.Queue()
+        self._midi_scan_results = queue.Queue()
+        self._midi_scan_pending = False
+        threading.Thread(target=self._midi_scan_worker, daemon=True).start()
+        # Latched once Push MIDI is configured, cleared again if MIDI disconnects
+        self._push_midi_configured = False
+        # Last time each periodic (non per-frame) delayed action was run
+        self._delayed_actions_last_run = dict.fromkeys(DELAYED_ACTIONS_INTERVALS, 0)
 
         # Initialize MIDI input state
         self.midi_in_device_name = None
@@ -218,7 +297,14 @@ class PushItApp(object):
         self.recording_buffer_track = None
         self.awaiting_buffer_slot = False
 
+        self.active_modes = {}
+        self._active_by_xor = {}
+        self._active_modes_reversed = ()
+        self._mode_hooks = {hook: () for hook in MODE_INPUT_HOOKS + MODE_UPDATE_HOOKS}
+        self._button_color_cache = {}
+
         self.init_push()
+        self.init_display_buffers()
         self.init_modes(self.settings)
 
         # Restore saved MIDI input device
@@ -241,6 +327,12 @@ class PushItApp(object):
         self.melodic_mode = MelodicMode(self, settings=settings)
         self.rhyhtmic_mode = RhythmicMode(self, settings=settings)
         self.slice_notes_mode = SliceNotesMode(self, settings=settings)
+        # Pad mode the melodic/rhythmic/slice toggle switches to from each of these (None means default pad mode)
+        self._next_pad_mode = {
+            self.melodic_mode: self.rhyhtmic_mode,
+            self.rhyhtmic_mode: self.slice_notes_mode,
+            self.slice_notes_mode: None,
+        }
         self.set_mode_for_xor_group(self.get_default_pad_mode_for_xor_group())
 
         self.clip_triggering_mode = ClipTriggeringMode(self, settings=settings)
@@ -254,9 +346,10 @@ class PushItApp(object):
         # since they're in the same XOR group as melodic_mode
         # and melodic_mode should be the default active mode for pads
         if settings.get("auto_open_last_project", True):
-            self.active_modes += [self.main_controls_mode, self.track_selection_mode, self.midi_cc_mode]
+            for mode in (self.main_controls_mode, self.track_selection_mode, self.midi_cc_mode):
+                self.add_active_mode(mode)
         else:
-            self.active_modes.append(self.add_track_mode)
+            self.add_active_mode(self.add_track_mode)
 
         # Note: clip_triggering_mode and clip_edit_mode are intentionally NOT added to active_modes here
         # because they're in the same XOR group as melodic_mode and melodic_mode is the default
@@ -269,16 +362,52 @@ class PushItApp(object):
         self.settings_mode = SettingsMode(self, settings=settings)
         self.scale_mode = ScaleMode(self, settings=settings)
 
-    def get_all_modes(self):
-        return [
+        # The set of mode objects is fixed from here on, so collect it once
+        # instead of scanning vars(self) every time it is needed
+        self._all_modes = tuple(
             getattr(self, element)
             for element in vars(self)
             if isinstance(getattr(self, element), definitions.PushItMode)
-        ]
+        )
+
+    def get_all_modes(self):
+        return self._all_modes
 
     def is_mode_active(self, mode):
         return mode in self.active_modes
 
+    def add_active_mode(self, mode):
+        """Adds mode to the active modes (without activating it or deactivating others in its xor_group)"""
+        self.active_modes[mode] = None
+        if mode.xor_group is not None:
+            self._active_by_xor.setdefault(mode.xor_group, []).append(mode)
+        self._rebuild_active_mode_caches()
+
+    def remove_active_mode(self, mode):
+        """Removes mode from the active modes (without deactivating it)"""
+        if mode in self.active_modes:
+            del self.active_modes[mode]
+            if mode.xor_group is not None:
+                group_modes = self._active_by_xor.get(mode.xor_group)
+                if group_modes and mode in group_modes:
+                    group_modes.remove(mode)
+        self._rebuild_active_mode_caches()
+
+    def _rebuild_active_mode_caches(self):
+        """Rebuild the per-hook lists of active mode methods. Modes change rarely compared to
+        input events and frames, so these are built once per change instead of walking
+        active_modes (and calling the no-op base class methods) every time."""
+        # Input event callbacks dispatch to the most recently activated mode first
+        self._active_modes_reversed = tuple(reversed(self.active_modes))
+        self._mode_hooks = {
+            hook: tuple(
+                getattr(mode, hook)
+                for mode in (self._active_modes_reversed if hook in MODE_INPUT_HOOKS else self.active_modes)
+                if getattr(type(mode), hook, None) is not getattr(definitions.PushItMode, hook)
+            )
+            for hook in MODE_INPUT_HOOKS + MODE_UPDATE_HOOKS
+        }
+
     def set_mode_for_xor_group(self, mode_to_set):
         """This activates the mode_to_set,
         but makes sure that if any other modes are currently activated for the same xor_group,
@@ -288,24 +417,20 @@ class PushItApp(object):
 
         if not self.is_mode_active(mode_to_set):
             # First deactivate all existing modes for that xor group
-            new_active_modes = []
-            for mode in self.active_modes:
-                if (
-                    mode.xor_group is not None
-                    and mode.xor_group == mode_to_set.xor_group
-                ):
+            if mode_to_set.xor_group is not None:
+                for mode in self._active_by_xor.pop(mode_to_set.xor_group, ()):
+                    del self.active_modes[mode]
                     mode.deactivate()
                     self.previously_active_mode_for_xor_group[mode.xor_group] = (
                         mode  # Store last mode that was active for the group
                     )
-                else:
-                    new_active_modes.append(mode)
+                self._active_by_xor[mode_to_set.xor_group] = [mode_to_set]
 
-            self.active_modes = new_active_modes
-
-            # Now add the mode to set to the active modes list and activate it
-            new_active_modes.append(mode_to_set)
+            # Now add the mode to set to the active modes and activate it
+            self.active_modes[mode_to_set] = None
+            self._rebuild_active_mode_caches()
             mode_to_set.activate()
+            self.display_needs_update = True
 
     def set_add_track_mode(self, settings=None):
         self.add_track_mode.initialize(settings=settings)
@@ -337,10 +462,9 @@ class PushItApp(object):
 
         if self.is_mode_active(mode_to_unset):
             # Deactivate the mode to unset
-            self.active_modes = [
-                mode for mode in self.active_modes if mode != mode_to_unset
-            ]
+            self.remove_active_mode(mode_to_unset)
             mode_to_unset.deactivate()
+            self.display_needs_update = True
 
             # Activate the previous mode that was activated for the same xor_group. If none listed, activate a default one
             previous_mode = self.previously_active_mode_for_xor_group.get(
@@ -355,7 +479,8 @@ class PushItApp(object):
                     # Check if we're exiting add_track_mode after creating a new track (no previous mode set)
                     # In this case, set up the full mode stack as if auto_open_last_project=True
                     if mode_to_unset == self.add_track_mode and self.add_track_mode.editing_track is None:
-                        self.active_modes += [self.main_controls_mode, self.track_selection_mode, self.midi_cc_mode]
+                        for mode in (self.main_controls_mode, self.track_selection_mode, self.midi_cc_mode):
+                            self.add_active_mode(mode)
                         self.main_controls_mode.activate()
                         self.track_selection_mode.activate()
                         self.midi_cc_mode.activate()
@@ -365,15 +490,13 @@ class PushItApp(object):
                     self.set_mode_for_xor_group(self.get_default_pad_mode_for_xor_group())
 
     def toggle_melodic_rhythmic_slice_modes(self):
-        if self.is_mode_active(self.melodic_mode):
-            self.set_rhythmic_mode()
-        elif self.is_mode_active(self.rhyhtmic_mode):
-            self.set_slice_notes_mode()
-        elif self.is_mode_active(self.slice_notes_mode):
-            self.set_mode_for_xor_group(self.get_default_pad_mode_for_xor_group())
-        else:
-            # If none of melodic or rhythmic or slice modes were active, enable default pad mode
-            self.set_mode_for_xor_group(self.get_default_pad_mode_for_xor_group())
+        next_mode = None
+        for mode in self._active_by_xor.get("pads", ()):
+            if mode in self._next_pad_mode:
+                next_mode = self._next_pad_mode[mode]
+                break
+        # After slice mode, or if none of melodic or rhythmic or slice modes were active, enable default pad mode
+        self.set_mode_for_xor_group(next_mode or self.get_default_pad_mode_for_xor_group())
 
     def set_melodic_mode(self):
         self.set_mode_for_xor_group(self.melodic_mode)
@@ -443,13 +566,28 @@ class PushItApp(object):
             mode_settings = mode.get_settings_to_save()
             if mode_settings:
                 settings.update(mode_settings)
-        # Ensure settings directory exists
-        os.makedirs(self.settings_dir, exist_ok=True)
-        # Write to file
-        json.dump(settings, open(self.settings_file, "w"))
+        # Serialize here (cheap) and leave the file write to the writer thread
+        self._settings_write_queue.put(json_dumps(settings))
         # Update in-memory settings to match the saved state
         self.settings = settings
 
+    def _settings_writer(self):
+        """Writes queued settings to disk. Runs in its own thread."""
+        while True:
+            data = self._settings_write_queue.get()
+            try:
+                # Ensure settings directory exists
+                os.makedirs(self.settings_dir, exist_ok=True)
+                # Write to a temp file first so an interrupted write never leaves a truncated settings file
+                tmp_file = self.settings_file + ".tmp"
+                with open(tmp_file, "w") as f:
+                    f.write(data)
+                os.replace(tmp_file, self.settings_file)
+            except OSError as e:
+                print("Error saving settings: {}".format(str(e)))
+            finally:
+                self._settings_write_queue.task_done()
+
     # MIDI input routing
     def start_midi_input(self, device_name: str):
         """
@@ -480,7 +618,7 @@ class PushItApp(object):
         velocity = midi_note.velocity
 
         # Record timestamp for duration calculation on note-off
-        self._note_on_times[pitch] = (time.time(), velocity)
+        self._note_on_times[pitch] = (time.monotonic(), velocity)
 
         # Passthru: forward to track output device if not muted
         if not track.passthru_muted:
@@ -504,7 +642,7 @@ class PushItApp(object):
         # Recording: route captured note to the current global record target
         if pitch in self._note_on_times and self.is_recording_armed:
             start_time, velocity = self._note_on_times.pop(pitch)
-            duration_secs = time.time() - start_time
+            duration_secs = time.monotonic() - start_time
             # Convert seconds to beats using current BPM
             duration_beats = duration_secs * (self.seq.bpm / 60.0)
             target = self._resolve_recording_target()
@@ -558,13 +696,13 @@ class PushItApp(object):
             # Timeline not running — find first empty step
             step = 0
             for s in range(clip.steps):
-                if clip.notes[s, 0] is None:
+                if clip.notes[s, 0] == definitions.NO_NOTE:
                     step = s
                     break
         # Write note into first available voice at that step
         note_written = False
         for voice in range(clip.max_polyphony):
-            if clip.notes[step, voice] is None:
+            if clip.notes[step, voice] == definitions.NO_NOTE:
                 clip.notes[step, voice] = pitch
                 clip.durations[step, voice] = max(
                     0.0,
@@ -579,8 +717,10 @@ class PushItApp(object):
         # numpy arrays and are not heard until the clip is rescheduled (e.g. by
         # editing a note). schedule_clip(replace=True) rebuilds the sequence in
         # place without restarting playback.
-        if note_written and clip.playing:
-            clip._reschedule_if_playing()
+        if note_written:
+            clip.update_status()
+            if clip.playing:
+                clip._reschedule_if_playing()
 
         self.pads_need_update = True
 
@@ -810,10 +950,12 @@ class PushItApp(object):
     # Push2-related functions
     def add_display_notification(self, text):
         self.notification_text = text
-        self.notification_time = time.time()
+        self._notification_surface = None
+        self.notification_time = time.monotonic()
+        self._notification_expires_at = self.notification_time + definitions.NOTIFICATION_TIME
+        self.display_needs_update = True
 
     def init_push(self):
-        print("Configuring Push...")
         print("Configuring Push...")
         use_simulator = "--simulator" in sys.argv or "-s" in sys.argv
         simulator_port = 6128
@@ -839,13 +981,106 @@ class PushItApp(object):
             # A better solution should be found.
             self.push.set_push2_reconnect_call_interval(2)
 
+    def init_display_buffers(self):
+        """Allocate the cairo surfaces (and their numpy views) used to render frames,
+        and start the thread that sends rendered frames to the Push.
+
+        Three surfaces are created once and reused by update_push2_display, so no image
+        buffer needs to be allocated per frame. At most one frame is being sent and one
+        is waiting to be sent (one of which is the last frame sent), so there is always
+        a free surface to draw the next one."""
+        w, h = (
+            push2_python.constants.DISPLAY_LINE_PIXELS,
+            push2_python.constants.DISPLAY_N_LINES,
+        )
+        self._display_surfaces = [
+            cairo.ImageSurface(cairo.FORMAT_RGB16_565, w, h) for _ in range(3)
+        ]
+        self._display_ctxs = [cairo.Context(s) for s in self._display_surfaces]
+        # get_data() exposes the surface's own pixel memory, so these views stay
+        # valid (and up to date) for the lifetime of the surfaces
+        self._display_frames = [
+            numpy.frombuffer(s.get_data(), dtype=numpy.uint16).reshape(h, w).T
+            for s in self._display_surfaces
+        ]
+        # A buffer is marked busy when queued for sending, and freed by the sender thread
+        self._display_busy = bytearray(len(self._display_surfaces))
+        # Last frame handed to the sender, kept untouched so new frames can be compared to it
+        self._display_last_idx = None
+        self._display_last_send_time = 0.0
+        self._display_queue = queue.Queue(maxsize=1)
+        threading.Thread(target=self._display_sender, daemon=True).start()
+
+    def _display_sender(self):
+        """Sends queued frames to the Push display. Runs in its own thread so that the
+        USB transfer does not hold up the main loop."""
+        while True:
+            idx = self._display_queue.get()
+            try:
+                self.push.display.display_frame(
+                    self._display_frames[idx],
+                    input_format=push2_python.constants.FRAME_FORMAT_RGB565,
+                )
+            except Exception as e:
+                print("Error sending display frame: {}".format(str(e)))
+            finally:
+                self._display_busy[idx] = 0
+
+    # Pad/button color setters. Modes use these instead of calling push2_python
+    # directly so that colors which did not change since last sent are not re-sent.
+    # Use force=True to re-send anyway, e.g. to restart a button animation
+    def set_button_color(self, button_name, color=definitions.WHITE, force=False, **kwargs):
+        state = (color, kwargs.get("animation"), kwargs.get("animation_end_color"))
+        if not force and self._button_color_cache.get(button_name) == state:
+            return
+        self._button_color_cache[button_name] = state
+        self.push.buttons.set_button_color(button_name, color, **kwargs)
+
+    def set_all_buttons_color(self, color=definitions.BLACK):
+        self._button_color_cache = {}
+        self.push.buttons.set_all_buttons_color(color=color)
+
+    def set_pads_color(self, color_matrix, animation_matrix=None):
+        colors = [list(row) for row in color_matrix]
+        animations = [list(row) for row in animation_matrix] if animation_matrix is not None else None
+        cached = self._pads_color_cache
+        if cached is not None and cached[1] == animations:
+            if cached[0] == colors:
+                return
+            if animations is None:
+                # Every pad color is a separate MIDI message, so only send the pads that changed
+                cached_colors = cached[0]
+                for i, row in enumerate(colors):
+                    for j, color in enumerate(row):
+                        if cached_colors[i][j] != color:
+                            self.push.pads.set_pad_color((i, j), color=color)
+                self._pads_color_cache = (colors, None)
+                return
+        self._pads_color_cache = (colors, animations)
+        self.push.pads.set_pads_color(color_matrix, animation_matrix)
+
+    def set_pad_color(self, pad_ij, color=definitions.WHITE):
+        cached = self._pads_color_cache
+        if cached is not None and cached[1] is None:
+            i, j = pad_ij
+            if cached[0][i][j] == color:
+                return
+            cached[0][i][j] = color
+        else:
+            self._pads_color_cache = None
+        self.push.pads.set_pad_color(pad_ij, color=color)
+
+    def set_all_pads_to_color(self, color=definitions.BLACK):
+        self._pads_color_cache = None
+        self.push.pads.set_all_pads_to_color(color=color)
+
     def update_push2_pads(self):
-        for mode in self.active_modes:
-            mode.update_pads()
+        for update_pads in self._mode_hooks["update_pads"]:
+            update_pads()
 
     def update_push2_buttons(self):
-        for mode in self.active_modes:
-            mode.update_buttons()
+        for update_buttons in self._mode_hooks["update_buttons"]:
+            update_buttons()
 
     def update_push2_display(self):
         if self.use_push2_display:
@@ -854,43 +1089,120 @@ class PushItApp(object):
                 push2_python.constants.DISPLAY_LINE_PIXELS,
                 push2_python.constants.DISPLAY_N_LINES,
             )
-            surface = cairo.ImageSurface(cairo.FORMAT_RGB16_565, w, h)
-            ctx = cairo.Context(surface)
+            idx = self._get_free_display_buffer_idx()
+            ctx = self._display_ctxs[idx]
+
+            # Clear the reused surface to black (a new surface used to start out black).
+            # The frame is a view of the surface memory, so this is a single memset
+            # instead of a cairo compositing pass; cairo is told the pixels changed
+            self._display_frames[idx].fill(0)
+            self._display_surfaces[idx].mark_dirty()
+
+            # Save the context state so anything modes leave behind (source,
+            # font, transforms...) is reset before the next frame
+            ctx.save()
 
             # Call all active modes to write to context
-            for mode in self.active_modes:
-                mode.update_display(ctx, w, h)
+            for update_display in self._mode_hooks["update_display"]:
+                update_display(ctx, w, h)
+
+            # Marquee text scrolls over time, so keep redrawing while any is shown
+            if MARQUEE_STATE:
+                self.display_needs_update = True
 
             # Show any notifications that should be shown
+            now = time.monotonic()
             if self.notification_text is not None:
-                time_since_notification_started = time.time() - self.notification_time
-                if time_since_notification_started < definitions.NOTIFICATION_TIME:
-                    show_notification(
-                        ctx,
-                        self.notification_text,
-                        opacity=1
-                        - time_since_notification_started
-                        / definitions.NOTIFICATION_TIME,
+                if now < self._notification_expires_at:
+                    # Text is only rendered once per notification, each frame just fades it
+                    if self._notification_surface is None:
+                        self._notification_surface = render_notification(self.notification_text)
+                    ctx.set_source_surface(self._notification_surface, 0, 0)
+                    ctx.paint_with_alpha(
+                        (self._notification_expires_at - now) / definitions.NOTIFICATION_TIME
                     )
                 else:
                     self.notification_text = None
+                    self._notification_surface = None
+                # Keep redrawing while the notification fades out, and once
+                # more after it expires so it gets removed from the screen
+                self.display_needs_update = True
+
+            ctx.restore()
+            self._display_surfaces[idx].flush()
+
+            # Skip sending frames identical to the last one sent (idle screens), but
+            # still send one every now and then to keep the Push display on
+            if (
+                self._display_last_idx is not None
+                and now - self._display_last_send_time < definitions.DISPLAY_KEEPALIVE_TIME
+                and numpy.array_equal(
+                    self._display_frames[idx], self._display_frames[self._display_last_idx]
+                )
+            ):
+                return
 
-            # Convert cairo data to numpy array and send to push
-            buf = surface.get_data()
-            frame = numpy.ndarray(
-                shape=(h, w), dtype=numpy.uint16, buffer=buf
-            ).transpose()
-            self.push.display.display_frame(
-                frame, input_format=push2_python.constants.FRAME_FORMAT_RGB565
-            )
+            self.queue_display_frame(idx, now)
+
+    def _get_free_display_buffer_idx(self):
+        """Index of a display buffer that is not being sent and is not the last frame sent"""
+        return next(
+            i
+            for i, busy in enumerate(self._display_busy)
+            if not busy and i != self._display_last_idx
+        )
+
+    def queue_display_frame(self, idx, now=None):
+        """Hand the frame drawn in display buffer idx over to the sender thread, which is the only
+        place frames are sent to the Push from. Never blocks: if the previous frame is still
+        waiting to be sent, that stale frame is dropped and replaced by this one."""
+        if now is None:
+            now = time.monotonic()
+        self._display_busy[idx] = 1
+        try:
+            self._display_queue.put_nowait(idx)
+        except queue.Full:
+            try:
+                stale_idx = self._display_queue.get_nowait()
+                self._display_busy[stale_idx] = 0
+            except queue.Empty:
+                pass  # The sender picked it up in the meantime
+            # Only the main thread puts frames, so there is room now
+            self._display_queue.put_nowait(idx)
+        self._display_last_idx = idx
+        self._display_last_send_time = now
+
+    def clear_display(self):
+        """Send an all-black frame to the Push display (e.g. when the display is turned off and
+        update_push2_display stops drawing)"""
+        idx = self._get_free_display_buffer_idx()
+        self._display_frames[idx].fill(0)
+        self._display_surfaces[idx].mark_dirty()
+        self.queue_display_frame(idx)
 
     def check_for_delayed_actions(self):
-        # Check for new MIDI devices periodically
-        current_time = time.time()
-        if current_time - self._last_midi_check_time > 5.0:
+        # Merge MIDI devices found by finished background scans
+        self.apply_midi_device_scans()
+
+        # Run slow-changing checks on their own intervals rather than every frame
+        current_time = time.monotonic()
+        last_run = self._delayed_actions_last_run
+        if current_time - last_run["midi_devices"] > DELAYED_ACTIONS_INTERVALS["midi_devices"]:
+            # Check for new MIDI devices periodically
             self.check_for_new_midi_devices()
-            self._last_midi_check_time = current_time
+            last_run["midi_devices"] = current_time
 
+        if current_time - last_run["midi_configured"] > DELAYED_ACTIONS_INTERVALS["midi_configured"]:
+            # If MIDI not configured, make sure we try sending messages so it gets configured
+            if not self._push_midi_configured:
+                if self.push.midi_is_configured():
+                    self._push_midi_configured = True
+                else:
+                    self.push.configure_midi()
+            last_run["midi_configured"] = current_time
+
+        # Queued clips and scene transitions are quantized to the timeline, so these
+        # are checked every frame (they return early when nothing is pending)
         # Check for queued clips that need to switch
         self.seq.check_queued_clips()
 
@@ -900,13 +1212,13 @@ class PushItApp(object):
         # Update playhead positions for all playing clips
         self.update_playhead_positions()
 
-        # If MIDI not configured, make sure we try sending messages so it gets configured
-        if not self.push.midi_is_configured():
-            self.push.configure_midi()
-
         # Call delayed actions in active modes
-        for mode in self.active_modes:
-            mode.check_for_delayed_actions()
+        for check_for_delayed_actions in self._mode_hooks["check_for_delayed_actions"]:
+            check_for_delayed_actions()
+
+        # Pads/buttons changes come from mode state changes, which might be shown on the display as well
+        if self.pads_need_update or self.buttons_need_update:
+            self.display_needs_update = True
 
         if self.pads_need_update:
             self.update_push2_pads()
@@ -920,59 +1232,124 @@ class PushItApp(object):
         """Update playhead positions for all playing clips."""
         if self.session is None:
             return
-        for track in self.session.tracks:
-            if track is None:
-                continue
-            for clip in track.clips:
-                if clip is not None and clip.playing:
-                    clip.update_playhead_position()
+        playing_clips = self.session.playing_clips
+        if not playing_clips:
+            return
+        current_time = self.global_timeline.current_time
+        for clip in playing_clips:
+            clip.update_playhead_position(current_time)
+        self.display_needs_update = True
 
         # If clip edit mode is active with a playing clip, update pads for playhead animation
         if self.is_mode_active(self.clip_edit_mode):
-            if self.clip_edit_mode.clip and self.clip_edit_mode.clip.playing:
+            if self.clip_edit_mode.clip in playing_clips:
                 self.pads_need_update = True
 
     def check_for_new_midi_devices(self):
-        """Check for newly connected MIDI devices"""
-        self.session.update_midi_devices()
+        """Check for newly connected MIDI devices. Enumerating and opening MIDI ports can take a
+        while, so the scan is queued for the MIDI scan worker thread and its result is merged
+        later on by apply_midi_device_scans"""
+        if self._midi_scan_pending:
+            # The previous scan has not finished (or not been merged) yet
+            return
+        self._midi_scan_pending = True
+        self._midi_scan_jobs.put(self.session.scan_midi_devices)
+
+    def _midi_scan_worker(self):
+        """Runs the queued MIDI device scans and posts their results. Runs in its own thread, it
+        only enumerates and opens ports and never modifies the session."""
+        while True:
+            scan = self._midi_scan_jobs.get()
+            try:
+                result = scan()
+            except Exception as e:
+                print("Error scanning MIDI devices: {}".format(str(e)))
+                result = None
+            self._midi_scan_results.put(result)
+
+    def apply_midi_device_scans(self):
+        """Merge the results of finished MIDI device scans into the session. Runs on the main
+        thread so the session device lists and dicts are only ever modified from there."""
+        while True:
+            try:
+                result = self._midi_scan_results.get_nowait()
+            except queue.Empty:
+                return
+            self._midi_scan_pending = False
+            if result is not None:
+                self.session.apply_midi_devices(result)
 
     def is_button_being_pressed(self, button_name):
         # global buttons_pressed_state
-        return buttons_pressed_state.get(button_name, False)
+        button_idx = BUTTON_INDEX.get(button_name)
+        return button_idx is not None and buttons_pressed_state[button_idx] == 1
 
     def measure_framerate(self, now):
         self.current_frame_rate_measurement += 1
-        if time.time() - self.current_frame_rate_measurement_second > 1.0:
+        if now - self.current_frame_rate_measurement_second > 1.0:
             self.actual_frame_rate = self.current_frame_rate_measurement
             self.current_frame_rate_measurement = 0
             self.current_frame_rate_measurement_second = now
-            print("{0} fps".format(self.actual_frame_rate))
+            if definitions.DEBUG_FPS:
+                print("{0} fps".format(self.actual_frame_rate))
+
+    def set_realtime_priority(self):
+        """Move the calling thread to the SCHED_FIFO real-time scheduling class so it is not preempted by
+        ordinary processes. Only available on Linux and needs CAP_SYS_NICE (see README)"""
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(definitions.REALTIME_PRIORITY))
+            print(f"Running with real-time priority {definitions.REALTIME_PRIORITY}")
+        except (AttributeError, OSError) as e:
+            print(f"Could not set real-time priority: {e}")
 
     def run_loop(self):
         print("PushIt is running...")
+        if self.settings.get("realtime_priority", False):
+            self.set_realtime_priority()
+        frame_period = 1.0 / self.target_frame_rate
+        next_deadline = time.monotonic() + frame_period
         try:
             while True:
-                before_draw_time = time.time()
-                # Draw ui
-                self.update_push2_display()
+                before_draw_time = time.monotonic()
+                # Draw ui, but only if something changed since the last frame.
+                # The display is still refreshed periodically to pick up any
+                # changes that were not flagged.
+                if (
+                    self.display_needs_update
+                    or before_draw_time - self._last_display_update_time
+                    > definitions.DISPLAY_IDLE_REFRESH_TIME
+                ):
+                    self.display_needs_update = False
+                    self._last_display_update_time = before_draw_time
+                    self.update_push2_display()
 
-                # Frame rate measurement
-                self.measure_framerate(time.time())
+                # Frame rate measurement (reuses the time sampled at the start of the frame)
+                self.measure_framerate(before_draw_time)
 
                 # Check if any delayed actions need to be applied
                 self.check_for_delayed_actions()
 
-                after_draw_time = time.time()
-
-                # Calculate sleep time to approximate the target frame rate
-                sleep_time = (1.0 / self.target_frame_rate) - (
-                    after_draw_time - before_draw_time
-                )
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
+                # Sleep until the next frame deadline. Deadlines advance by a fixed
+                # period so the frame rate does not drift, but if we fell more than a
+                # frame behind, skip ahead instead of trying to catch up.
+                now = time.monotonic()
+                sleep_time = next_deadline - now
+                if sleep_time > definitions.FRAME_SPIN_TIME:
+                    # time.sleep can overshoot by the kernel timer slack, so wake up a
+                    # bit early and poll the clock for the rest of the frame. sleep(0)
+                    # releases the GIL so the timeline and MIDI threads are not starved
+                    time.sleep(sleep_time - definitions.FRAME_SPIN_TIME)
+                while time.monotonic() < next_deadline:
+                    time.sleep(0)
+                if sleep_time < -frame_period:
+                    next_deadline = now + frame_period
+                else:
+                    next_deadline += frame_period
 
         except KeyboardInterrupt:
             print("Exiting PushIt...")
+            # Make sure pending settings writes reach the disk before exiting
+            self._settings_write_queue.join()
             self.push.buttons.set_all_buttons_color("black")
             self.push.pads.set_all_pads_to_black()
             self.push.f_stop.set()
@@ -998,8 +1375,8 @@ class PushItApp(object):
         self.push.reapply_color_palette()
 
         # Initialize all buttons to black, initialize all pads to off
-        self.push.buttons.set_all_buttons_color(color=definitions.BLACK)
-        self.push.pads.set_all_pads_to_color(color=definitions.BLACK)
+        self.set_all_buttons_color(color=definitions.BLACK)
+        self.set_all_pads_to_color(color=definitions.BLACK)
 
         # Iterate over modes and (re-)activate them
         for mode in self.active_modes:
@@ -1013,13 +1390,21 @@ class PushItApp(object):
 # Bind push action handlers with class methods
 @push2_python.on_encoder_touched()
 def on_encoder_touched(_, encoder_name):
-    print(f"encoder {encoder_name} touched")
+    if app is None:
+        return
+    app.display_needs_update = True
+    if definitions.DEBUG_ENCODER_EVENTS:
+        print(f"encoder {encoder_name} touched")
     encoder_touch_state[encoder_name] = True
 
 
 @push2_python.on_encoder_released()
 def on_encoder_released(_, encoder_name):
-    print(f"encoder {encoder_name} released")
+    if app is None:
+        return
+    app.display_needs_update = True
+    if definitions.DEBUG_ENCODER_EVENTS:
+        print(f"encoder {encoder_name} released")
     if encoder_name == push2_python.constants.ENCODER_TEMPO_ENCODER:
         if encoder_touch_state.get(encoder_name, False):
             # Show tempo notification
@@ -1031,140 +1416,138 @@ def on_encoder_released(_, encoder_name):
 
 @push2_python.on_encoder_rotated()
 def on_encoder_rotated(_, encoder_name, increment):
-    try:
-        if encoder_name == push2_python.constants.ENCODER_TEMPO_ENCODER:
-            shift_held = app.is_button_being_pressed(push2_python.constants.BUTTON_SHIFT)
-            bpm_increment = 0.1 if shift_held else 1.0
-            new_bpm = app.seq.bpm + increment * bpm_increment
-            if new_bpm < 40:
-                new_bpm = 40
-            elif new_bpm > 240:
-                new_bpm = 240
-            app.seq.bpm = new_bpm
-            tempo_text = f"{new_bpm:.1f} BPM"
-            app.add_display_notification(tempo_text)
-            return
-
-        for mode in app.active_modes[::-1]:
-            action_performed = mode.on_encoder_rotated(encoder_name, increment)
-            if action_performed:
-                break  # If mode took action, stop event propagation
-    except NameError as e:
-        print("Error:  {}".format(str(e)))
-        traceback.print_exc()
+    if app is None:
+        return
+    app.display_needs_update = True
+    if encoder_name == push2_python.constants.ENCODER_TEMPO_ENCODER:
+        shift_held = app.is_button_being_pressed(push2_python.constants.BUTTON_SHIFT)
+        bpm_increment = 0.1 if shift_held else 1.0
+        new_bpm = app.seq.bpm + increment * bpm_increment
+        if new_bpm < 40:
+            new_bpm = 40
+        elif new_bpm > 240:
+            new_bpm = 240
+        app.seq.bpm = new_bpm
+        tempo_text = f"{new_bpm:.1f} BPM"
+        app.add_display_notification(tempo_text)
+        return
+
+    for on_encoder_rotated in app._mode_hooks["on_encoder_rotated"]:
+        action_performed = on_encoder_rotated(encoder_name, increment)
+        if action_performed:
+            break  # If mode took action, stop event propagation
 
 
 @push2_python.on_pad_pressed()
 def on_pad_pressed(_, pad_n, pad_ij, velocity):
-    try:
-        # Track pad press time for long press detection
-        pads_pressed_state[pad_n] = {"time": time.time(), "handled": False}
+    if app is None:
+        return
+    app.display_needs_update = True
+    # Track pad press time for long press detection
+    pads_press_time[pad_n] = time.monotonic()
+    pads_handled[pad_n] = 0
+    if definitions.DEBUG_PAD_EVENTS:
         print(
-            f"Pad pressed event: pad_n={pad_n}, velocity={velocity}, active_modes={[type(m).__name__ for m in app.active_modes[::-1]]}"
+            f"Pad pressed event: pad_n={pad_n}, velocity={velocity}, active_modes={[m._type_name for m in app._active_modes_reversed]}"
         )
 
-        for mode in app.active_modes[::-1]:
-            action_performed = mode.on_pad_pressed(pad_n, pad_ij, velocity)
-            print(f"  Mode {type(mode).__name__} returned {action_performed}")
-            if action_performed:
-                print(f"  -> {type(mode).__name__} handled the event")
-                pads_pressed_state[pad_n]["handled"] = True
-                break  # If mode took action, stop event propagation
-    except NameError as e:
-        print("Error:  {}".format(str(e)))
-        traceback.print_exc()
+    for on_pad_pressed in app._mode_hooks["on_pad_pressed"]:
+        action_performed = on_pad_pressed(pad_n, pad_ij, velocity)
+        if definitions.DEBUG_PAD_EVENTS:
+            print(f"  Mode {on_pad_pressed.__self__._type_name} returned {action_performed}")
+        if action_performed:
+            if definitions.DEBUG_PAD_EVENTS:
+                print(f"  -> {on_pad_pressed.__self__._type_name} handled the event")
+            pads_handled[pad_n] = 1
+            break  # If mode took action, stop event propagation
 
 
 @push2_python.on_pad_released()
 def on_pad_released(_, pad_n, pad_ij, velocity):
-    try:
-        press_state = pads_pressed_state.get(pad_n, None)
-        is_long_press = False
-        if press_state is not None:
-            press_time = press_state.get("time", time.time())
-            if time.time() - press_time > definitions.BUTTON_QUICK_PRESS_TIME:
-                is_long_press = True
-            del pads_pressed_state[pad_n]
-
-        # Call long press handler first if applicable
-        if is_long_press:
-            for mode in app.active_modes[::-1]:
-                if hasattr(mode, "on_pad_long_pressed"):
-                    action_performed = mode.on_pad_long_pressed(pad_n, pad_ij, velocity)
-                    if action_performed:
-                        # Long press was handled, skip regular release
-                        return
-
-        # Call regular release handler only if not a long press or long press wasn't handled
-        for mode in app.active_modes[::-1]:
-            action_performed = mode.on_pad_released(pad_n, pad_ij, velocity)
+    if app is None:
+        return
+    app.display_needs_update = True
+    press_time = pads_press_time[pad_n]
+    is_long_press = False
+    if press_time:
+        if time.monotonic() - press_time > definitions.BUTTON_QUICK_PRESS_TIME:
+            is_long_press = True
+        pads_press_time[pad_n] = 0.0
+
+    # Call long press handler first if applicable
+    if is_long_press:
+        for on_pad_long_pressed in app._mode_hooks["on_pad_long_pressed"]:
+            action_performed = on_pad_long_pressed(pad_n, pad_ij, velocity)
             if action_performed:
-                break
-    except NameError as e:
-        print("Error:  {}".format(str(e)))
-        traceback.print_exc()
+                # Long press was handled, skip regular release
+                return
+
+    # Call regular release handler only if not a long press or long press wasn't handled
+    for on_pad_released in app._mode_hooks["on_pad_released"]:
+        action_performed = on_pad_released(pad_n, pad_ij, velocity)
+        if action_performed:
+            break
 
 
 @push2_python.on_pad_aftertouch()
 def on_pad_aftertouch(_, pad_n, pad_ij, velocity):
-    try:
-        for mode in app.active_modes[::-1]:
-            action_performed = mode.on_pad_aftertouch(pad_n, pad_ij, velocity)
-            if action_performed:
-                break  # If mode took action, stop event propagation
-    except NameError as e:
-        print("Error:  {}".format(str(e)))
-        traceback.print_exc()
+    if app is None:
+        return
+    app.display_needs_update = True
+    for on_pad_aftertouch in app._mode_hooks["on_pad_aftertouch"]:
+        action_performed = on_pad_aftertouch(pad_n, pad_ij, velocity)
+        if action_performed:
+            break  # If mode took action, stop event propagation
 
 
 @push2_python.on_button_pressed()
 def on_button_pressed(_, name):
-    buttons_pressed_state[name] = True
-    try:
-        for mode in app.active_modes[::-1]:
-            action_performed = mode.on_button_pressed(name)
-            if action_performed:
-                break  # If mode took action, stop event propagation
-    except NameError as e:
-        print(f"Error:  {str(e)}")
-        traceback.print_exc()
+    button_idx = BUTTON_INDEX.get(name)
+    if button_idx is not None:
+        buttons_pressed_state[button_idx] = 1
+    if app is None:
+        return
+    app.display_needs_update = True
+    for on_button_pressed in app._mode_hooks["on_button_pressed"]:
+        action_performed = on_button_pressed(name)
+        if action_performed:
+            break  # If mode took action, stop event propagation
 
 
 @push2_python.on_button_released()
 def on_button_released(_, name):
-    buttons_pressed_state[name] = False
-    try:
-        for mode in app.active_modes[::-1]:
-            action_performed = mode.on_button_released(name)
-            if action_performed:
-                break  # If mode took action, stop event propagation
-    except NameError as e:
-        print("Error:  {}".format(str(e)))
-        traceback.print_exc()
+    button_idx = BUTTON_INDEX.get(name)
+    if button_idx is not None:
+        buttons_pressed_state[button_idx] = 0
+    if app is None:
+        return
+    app.display_needs_update = True
+    for on_button_released in app._mode_hooks["on_button_released"]:
+        action_performed = on_button_released(name)
+        if action_performed:
+            break  # If mode took action, stop event propagation
 
 
 @push2_python.on_touchstrip()
 def on_touchstrip(_, value):
-    try:
-        for mode in app.active_modes[::-1]:
-            action_performed = mode.on_touchstrip(value)
-            if action_performed:
-                break  # If mode took action, stop event propagation
-    except NameError as e:
-        print("Error:  {}".format(str(e)))
-        traceback.print_exc()
+    if app is None:
+        return
+    app.display_needs_update = True
+    for on_touchstrip in app._mode_hooks["on_touchstrip"]:
+        action_performed = on_touchstrip(value)
+        if action_performed:
+            break  # If mode took action, stop event propagation
 
 
 @push2_python.on_sustain_pedal()
 def on_sustain_pedal(_, sustain_on):
-    try:
-        for mode in app.active_modes[::-1]:
-            action_performed = mode.on_sustain_pedal(sustain_on)
-            if action_performed:
-                break  # If mode took action, stop event propagation
-    except NameError as e:
-        print("Error:  {}".format(str(e)))
-        traceback.print_exc()
+    if app is None:
+        return
+    app.display_needs_update = True
+    for on_sustain_pedal in app._mode_hooks["on_sustain_pedal"]:
+        action_performed = on_sustain_pedal(sustain_on)
+        if action_performed:
+            break  # If mode took action, stop event propagation
 
 
 midi_connected_received_before_app = False
@@ -1172,13 +1555,19 @@ midi_connected_received_before_app = False
 
 @push2_python.on_midi_connected()
 def on_midi_connected(_):
-    try:
-        app.on_midi_push_connection_established()
-    except NameError as e:
-        global midi_connected_received_before_app
+    global midi_connected_received_before_app
+    if app is None:
+        # The app will do the Push configuration once it has been created
         midi_connected_received_before_app = True
-        print("Error:  {}".format(str(e)))
-        traceback.print_exc()
+        return
+    app.on_midi_push_connection_established()
+
+
+@push2_python.on_midi_disconnected()
+def on_midi_disconnected(_):
+    if app is None:
+        return
+    app._push_midi_configured = False
 
 
 # Run app main loop
@@ -1,6 +1,7 @@
 class BaseClass(object):
 
-    _parent = None
+    # Subclasses that don't declare __slots__ themselves still get a __dict__
+    __slots__ = ("_parent",)
 
     def __init__(self, parent=None):
         # Set parent
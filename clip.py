@@ -1,3 +1,4 @@
+from operator import attrgetter
 from typing import TYPE_CHECKING, NamedTuple
 import isobar as iso
 import numpy as np
@@ -17,25 +18,86 @@ class ClipStatus(NamedTuple):
     quantization_step: float
 
 
+# One record per visible note, as returned by Clip.get_notes_for_rendering()
+RENDER_NOTE_DTYPE = np.dtype([
+    ("pad_i", np.int16),
+    ("pad_j", np.int16),
+    ("step_idx", np.int32),
+    ("note", np.int16),
+    ("velocity", np.uint8),
+    ("duration_steps", np.int32),
+])
+
+
+def _cache_input(slot, status=True, sequence=False):
+    """Property for a Clip attribute that a cached result is computed from. Assigning it clears the
+    cached status (get_status) and/or sequence data (get_sequence_data_for_timeline). Changes made
+    in place, like writing into the notes array, don't go through here and must call update_status()"""
+    def set_value(self, value):
+        setattr(self, slot, value)
+        if status:
+            self._status = None
+        if sequence:
+            self._sequence_data = None
+    return property(attrgetter(slot), set_value)
+
+
 class Clip(BaseClass):
+    # There is a Clip per session slot, slots keep instances small and attribute access fast.
+    # New instance attributes must be added here
+    __slots__ = (
+        "_amplitudes",
+        "_clip_length_in_beats",
+        "_current_quantization_step",
+        "_durations",
+        "_notes",
+        "_playback_start_time",
+        "_playing",
+        "_recording",
+        "_sequence_data",
+        "_status",
+        "_step_divisions",
+        "_steps",
+        "_will_play_at",
+        "_will_start_recording_at",
+        "_will_stop_at",
+        "_will_stop_recording_at",
+        "beats_per_bar",
+        "bpm_multiplier",
+        "max_polyphony",
+        "name",
+        "playhead_position_in_beats",
+        "queued_clip",
+        "queued_for_recording",
+        "window_note_offset",
+        "window_step_offset",
+        "wrap_events_across_clip_loop",
+    )
+
     bpm_multiplier: float
     clip_length_in_beats: float  # assuming 4/4, 1 bar = 4 beats
     beats_per_bar: int
     step_divisions: int  # determines what length note each pad represents
     steps: int
     pages: int
-    clip_status: ClipStatus
-    current_quantization_step: float
-    name: str = None
-    notes: list
+    name: str
     playhead_position_in_beats: float
-    playing: bool
-    recording: bool
-    will_play_at: float
-    will_stop_at: float
-    will_start_recording_at: float
-    will_stop_recording_at: float
     wrap_events_across_clip_loop: bool
+    _status: ClipStatus  # cached result of get_status(), None when it needs to be recomputed
+    _sequence_data: dict  # cached result of get_sequence_data_for_timeline()
+
+    # Attributes get_status() is computed from (with clip_length_in_beats)
+    playing: bool = _cache_input("_playing")
+    recording: bool = _cache_input("_recording")
+    will_play_at: float = _cache_input("_will_play_at")
+    will_stop_at: float = _cache_input("_will_stop_at")
+    will_start_recording_at: float = _cache_input("_will_start_recording_at")
+    will_stop_recording_at: float = _cache_input("_will_stop_recording_at")
+    current_quantization_step: float = _cache_input("_current_quantization_step")
+    # Sequence arrays get_sequence_data_for_timeline() is built from, notes also give the empty status
+    notes: np.ndarray = _cache_input("_notes", sequence=True)
+    durations: np.ndarray = _cache_input("_durations", status=False, sequence=True)
+    amplitudes: np.ndarray = _cache_input("_amplitudes", status=False, sequence=True)
 
     @property
     def track(self) -> "Track":
@@ -50,12 +112,15 @@ class Clip(BaseClass):
     @property
     def app(self):
         """Get the app instance through parent chain"""
-        return self.track.app if hasattr(self._parent, "app") else None
+        return getattr(self._parent, "app", None)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self._status = None
+        self._sequence_data = None
 
         # default clip properties
+        self.name = None
         self.playing = False
         self.recording = False
         self.will_play_at = -1.0
@@ -65,9 +130,7 @@ class Clip(BaseClass):
         self._clip_length_in_beats = 4.0
         self.beats_per_bar = 4
         self._step_divisions = 16  # 1/16 notes
-        self._steps = int(
-            (self._clip_length_in_beats / self.beats_per_bar) * self._step_divisions
-        )
+        self._steps = self._steps_for_length()
         self.current_quantization_step = 0.0
         self.playhead_position_in_beats = 0.0
         self._playback_start_time = 0.0  # Timeline time when clip started playing
@@ -80,8 +143,9 @@ class Clip(BaseClass):
         # recording onto a clip while another clip on the same track finishes.
         self.queued_for_recording = False
 
-        # clip sequence properties - numpy arrays for polyphonic step sequencing
-        self.notes = np.full((self.steps, self.max_polyphony), None, dtype=object)
+        # clip sequence properties - numpy arrays for polyphonic step sequencing.
+        # Empty voice slots in notes hold definitions.NO_NOTE
+        self.notes = np.full((self.steps, self.max_polyphony), definitions.NO_NOTE, dtype=np.int16)
         self.durations = np.zeros((self.steps, self.max_polyphony), dtype=np.float32)
         self.amplitudes = np.zeros((self.steps, self.max_polyphony), dtype=np.uint8)
 
@@ -89,8 +153,6 @@ class Clip(BaseClass):
         self.window_step_offset = 0
         self.window_note_offset = 60  # Start at middle C
 
-        self.clip_status = self.get_status()
-
     def step_beats(self) -> float:
         """Number of beats represented by a single step."""
         if self.steps > 0 and self.clip_length_in_beats > 0:
@@ -130,10 +192,11 @@ class Clip(BaseClass):
             return
 
         for voice in range(self.max_polyphony):
-            if self.notes[step_idx, voice] is None:
+            if self.notes[step_idx, voice] == definitions.NO_NOTE:
                 self.notes[step_idx, voice] = midi_note
                 self.durations[step_idx, voice] = duration
                 self.amplitudes[step_idx, voice] = velocity
+                self.update_status()
                 if self.playing:
                     self._reschedule_if_playing()
                 return
@@ -143,55 +206,53 @@ class Clip(BaseClass):
         if not (0 <= step_idx < self.steps):
             return
 
-        for voice in range(self.max_polyphony):
-            if self.notes[step_idx, voice] == midi_note:
-                # Shift remaining voices down
-                for v in range(voice, self.max_polyphony - 1):
-                    self.notes[step_idx, v] = self.notes[step_idx, v + 1]
-                    self.durations[step_idx, v] = self.durations[step_idx, v + 1]
-                    self.amplitudes[step_idx, v] = self.amplitudes[step_idx, v + 1]
-
-                # Clear the last slot
-                self.notes[step_idx, self.max_polyphony - 1] = None
-                self.durations[step_idx, self.max_polyphony - 1] = 0.0
-                self.amplitudes[step_idx, self.max_polyphony - 1] = 0
+        matches = np.flatnonzero(self.notes[step_idx] == midi_note)
+        if len(matches) == 0:
+            return
+        voice = matches[0]
 
-                if self.playing:
-                    self._reschedule_if_playing()
-                return
+        # Shift remaining voices down (slice copies handle overlapping ranges)
+        self.notes[step_idx, voice:-1] = self.notes[step_idx, voice + 1:]
+        self.durations[step_idx, voice:-1] = self.durations[step_idx, voice + 1:]
+        self.amplitudes[step_idx, voice:-1] = self.amplitudes[step_idx, voice + 1:]
+
+        # Clear the last slot
+        self.notes[step_idx, -1] = definitions.NO_NOTE
+        self.durations[step_idx, -1] = 0.0
+        self.amplitudes[step_idx, -1] = 0
 
-    def get_notes_for_rendering(self) -> list:
-        """Get all notes in the current window for rendering on pads"""
-        notes_to_render = []
-
-        for step_j in range(definitions.GRID_WIDTH):
-            step_idx = step_j + self.window_step_offset
-            if step_idx >= self.steps:
-                continue
-
-            for voice in range(self.max_polyphony):
-                note = self.notes[step_idx, voice]
-                if note is None:
-                    continue
-
-                # Check if note is in visible window
-                if self.window_note_offset <= note < self.window_note_offset + definitions.GRID_WIDTH:
-                    pad_i = 7 - (note - self.window_note_offset)
-                    pad_j = step_j
-                    notes_to_render.append(
-                        {
-                            "pad_i": pad_i,
-                            "pad_j": pad_j,
-                            "step_idx": step_idx,
-                            "note": note,
-                            "velocity": self.amplitudes[step_idx, voice],
-                            "duration_steps": self.note_duration_in_steps(
-                                step_idx, voice
-                            ),
-                        }
-                    )
-
-        return notes_to_render
+        self.update_status()
+        if self.playing:
+            self._reschedule_if_playing()
+
+    def get_notes_for_rendering(self) -> np.ndarray:
+        """Get all notes in the current window for rendering on pads, as a structured array
+        with one RENDER_NOTE_DTYPE record per note. Read whole columns (e.g. rendered["pad_i"])
+        rather than iterating records"""
+        start = self.window_step_offset
+        end = start + definitions.GRID_WIDTH
+        window = self.notes[start:end]
+
+        # Empty slots hold NO_NOTE (-1), which is never inside the visible note range,
+        # so a single range mask selects the notes to render
+        note_offset = self.window_note_offset
+        mask = (window >= note_offset) & (window < note_offset + definitions.GRID_WIDTH)
+        step_js, voices = np.nonzero(mask)
+
+        rendered = np.empty(len(step_js), dtype=RENDER_NOTE_DTYPE)
+        notes = window[step_js, voices]
+        rendered["pad_i"] = 7 - (notes - note_offset)
+        rendered["pad_j"] = step_js
+        rendered["step_idx"] = step_js + start
+        rendered["note"] = notes
+        rendered["velocity"] = self.amplitudes[start:end][step_js, voices]
+        step_beats = self.step_beats()
+        if step_beats > 0:
+            durations = self.durations[start:end][step_js, voices]
+            rendered["duration_steps"] = np.maximum(1, np.rint(durations / step_beats))
+        else:
+            rendered["duration_steps"] = 1
+        return rendered
 
     def get_note_range(self):
         """Get the highest and lowest notes in the clip.
@@ -199,8 +260,7 @@ class Clip(BaseClass):
         Returns:
             tuple: (lowest, highest) MIDI note values, or (None, None) if clip is empty.
         """
-        mask = np.not_equal(self.notes, None)
-        all_notes = self.notes[mask]
+        all_notes = self.notes[self.notes != definitions.NO_NOTE]
         if len(all_notes) == 0:
             return None, None
         return int(np.min(all_notes)), int(np.max(all_notes))
@@ -211,13 +271,25 @@ class Clip(BaseClass):
         Returns:
             list: Sorted list of unique MIDI note values, or empty list if clip is empty.
         """
-        mask = np.not_equal(self.notes, None)
-        all_notes = self.notes[mask]
+        all_notes = self.notes[self.notes != definitions.NO_NOTE]
         if len(all_notes) == 0:
             return []
-        return sorted(set(int(n) for n in all_notes))
+        return [int(n) for n in np.unique(all_notes)]
+
+    @property
+    def clip_status(self) -> ClipStatus:
+        """Get the current clip status"""
+        return self.get_status()
 
     def get_status(self) -> ClipStatus:
+        """Get the current clip status. The status is cached, as it is queried for every clip on every
+        redraw of the clip triggering mode, and only recomputed after one of the _cache_input properties
+        it depends on or clip_length_in_beats is set, or after update_status() is called"""
+        if self._status is None:
+            self._status = self._compute_status()
+        return self._status
+
+    def _compute_status(self) -> ClipStatus:
         if self.will_start_recording_at >= 0.0:
             record_status = definitions.ClipStates.CLIP_STATUS_CUED_TO_RECORD
         elif self.will_stop_recording_at >= 0.0:
@@ -250,12 +322,10 @@ class Clip(BaseClass):
         )
 
     def is_empty(self):
-        # self.notes is an object array of None placeholders; a clip is empty
-        # only when every slot is None. Compare element-wise so a fresh clip
-        # (all None) is correctly reported as empty.
+        # A clip is empty only when every voice slot holds NO_NOTE
         if self.notes is None:
             return True
-        return all(note is None for note in self.notes.flat)
+        return not (self.notes != definitions.NO_NOTE).any()
 
 
     def play_stop(self):
@@ -272,35 +342,40 @@ class Clip(BaseClass):
         if self.track is None:
             return
 
-        if self.app and hasattr(self.app, "seq"):
+        # Resolve the app through the parent chain only once
+        app = self.app
+        if app and hasattr(app, "seq"):
             # Call session to schedule the clip start.
             # schedule_clip will set _playback_start_time to the actual scheduled start time
-            self.app.seq.schedule_clip(self, quantize_start=quantize_start)
+            app.seq.schedule_clip(self, quantize_start=quantize_start)
 
         # Mark clip as playing after timing has been set by schedule_clip
         self.playing = True
+        if app and hasattr(app, "session"):
+            app.session.playing_clips.add(self)
         self.will_play_at = -1.0
 
-        # Update the clip status by calling get_status()
-        self.clip_status = self.get_status()
-
     def stop(self):
         """Set the clip to cue to stop and stop playback through the session."""
         if self.track is None:
             return
 
-        if self.app and hasattr(self.app, "global_timeline"):
+        # Resolve the app through the parent chain only once
+        app = self.app
+        if app and hasattr(app, "global_timeline"):
             # Find and unschedule the clip from timeline by name
-            for track in self.app.global_timeline.tracks:
+            for track in app.global_timeline.tracks:
                 if track.name == self.name:
                     try:
-                        self.app.global_timeline.unschedule(track)
+                        app.global_timeline.unschedule(track)
                     except iso.TrackNotFoundException:
                         pass  # Track may not be scheduled
                     break
 
         # Mark clip as stopped
         self.playing = False
+        if app and hasattr(app, "session"):
+            app.session.playing_clips.discard(self)
         self.will_stop_at = -1.0
         self.playhead_position_in_beats = 0.0
         self._playback_start_time = 0.0
@@ -316,13 +391,13 @@ class Clip(BaseClass):
                 next_clip.queued_for_recording = False
                 next_clip.will_start_recording_at = -1.0
                 next_clip.recording = True
-                if self.app is not None and hasattr(self.app, "recording_target"):
-                    self.app.recording_target = next_clip
+                if app is not None and hasattr(app, "recording_target"):
+                    app.recording_target = next_clip
             # Ensure both clips update their status and trigger UI refresh
             self.update_status()
             next_clip.update_status()
-            if self.app and self.app.is_mode_active("clip_triggering_mode"):
-                self.app.clip_triggering_mode.update_pads()
+            if app and app.is_mode_active("clip_triggering_mode"):
+                app.clip_triggering_mode.update_pads()
 
         self.update_status()
 
@@ -343,13 +418,16 @@ class Clip(BaseClass):
 
     def update_status(self):
         """Update the clip status based on current state.
-        Call this after modifying state variables."""
-        self.clip_status = self.get_status()
+        Call this after modifying state variables in place (e.g. writing into the notes array)."""
+        self._status = None
+        self._sequence_data = None
 
     def clear(self):
-        self.notes = np.full((self.steps, self.max_polyphony), None, dtype=object)
-        self.durations = np.zeros((self.steps, self.max_polyphony), dtype=np.float32)
-        self.amplitudes = np.zeros((self.steps, self.max_polyphony), dtype=np.uint8)
+        # Clear in place, the arrays already have the right shape
+        self.notes.fill(definitions.NO_NOTE)
+        self.durations.fill(0.0)
+        self.amplitudes.fill(0)
+        self.update_status()
 
     def double(self):
         self.notes = np.vstack([self.notes, self.notes])
@@ -363,6 +441,37 @@ class Clip(BaseClass):
     def set_bpm_multiplier(self, new_bpm_multiplier):
         self.bpm_multiplier = new_bpm_multiplier
 
+    def _steps_for_length(self) -> int:
+        """Number of steps given by the clip length and step divisions (read from the
+        private fields, not through the properties)"""
+        return int((self._clip_length_in_beats / self.beats_per_bar) * self._step_divisions)
+
+    def _recompute_steps(self) -> None:
+        """Resize the clip to the number of steps given by its length and step divisions"""
+        self._resize(self._steps_for_length())
+
+    def _resize(self, new_steps: int) -> None:
+        """Resize the sequence arrays to new_steps, keeping the existing steps that still fit.
+        All step count changes go through here."""
+        if new_steps == self._steps:
+            return
+        old_steps = self._steps
+        self._steps = new_steps
+
+        new_notes = np.full((new_steps, self.max_polyphony), definitions.NO_NOTE, dtype=np.int16)
+        new_durations = np.zeros((new_steps, self.max_polyphony), dtype=np.float32)
+        new_amplitudes = np.zeros((new_steps, self.max_polyphony), dtype=np.uint8)
+
+        # Copy old data
+        copy_steps = min(old_steps, new_steps)
+        new_notes[:copy_steps] = self.notes[:copy_steps]
+        new_durations[:copy_steps] = self.durations[:copy_steps]
+        new_amplitudes[:copy_steps] = self.amplitudes[:copy_steps]
+
+        self.notes = new_notes
+        self.durations = new_durations
+        self.amplitudes = new_amplitudes
+
     @property
     def clip_length_in_beats(self) -> float:
         """Get the clip length in beats"""
@@ -372,28 +481,8 @@ class Clip(BaseClass):
     def clip_length_in_beats(self, value: float) -> None:
         """Set the clip length in beats and update dependent properties"""
         self._clip_length_in_beats = value
-        new_steps = int(
-            (self._clip_length_in_beats / self.beats_per_bar) * self.step_divisions
-        )
-
-        # Resize arrays if step count changed
-        if new_steps != self._steps:
-            old_steps = self._steps
-            self._steps = new_steps
-
-            new_notes = np.full((new_steps, self.max_polyphony), None, dtype=object)
-            new_durations = np.zeros((new_steps, self.max_polyphony), dtype=np.float32)
-            new_amplitudes = np.zeros((new_steps, self.max_polyphony), dtype=np.uint8)
-
-            # Copy old data
-            copy_steps = min(old_steps, new_steps)
-            new_notes[:copy_steps] = self.notes[:copy_steps]
-            new_durations[:copy_steps] = self.durations[:copy_steps]
-            new_amplitudes[:copy_steps] = self.amplitudes[:copy_steps]
-
-            self.notes = new_notes
-            self.durations = new_durations
-            self.amplitudes = new_amplitudes
+        self._status = None
+        self._recompute_steps()
 
     @property
     def step_divisions(self) -> int:
@@ -404,28 +493,7 @@ class Clip(BaseClass):
     def step_divisions(self, value: int) -> None:
         """Set the step divisions and update dependent properties"""
         self._step_divisions = value
-        new_steps = int(
-            (self.clip_length_in_beats / self.beats_per_bar) * self._step_divisions
-        )
-
-        # Resize arrays if step count changed
-        if new_steps != self._steps:
-            old_steps = self._steps
-            self._steps = new_steps
-
-            new_notes = np.full((new_steps, self.max_polyphony), None, dtype=object)
-            new_durations = np.zeros((new_steps, self.max_polyphony), dtype=np.float32)
-            new_amplitudes = np.zeros((new_steps, self.max_polyphony), dtype=np.uint8)
-
-            # Copy old data
-            copy_steps = min(old_steps, new_steps)
-            new_notes[:copy_steps] = self.notes[:copy_steps]
-            new_durations[:copy_steps] = self.durations[:copy_steps]
-            new_amplitudes[:copy_steps] = self.amplitudes[:copy_steps]
-
-            self.notes = new_notes
-            self.durations = new_durations
-            self.amplitudes = new_amplitudes
+        self._recompute_steps()
 
     @property
     def steps(self) -> int:
@@ -435,46 +503,61 @@ class Clip(BaseClass):
     @steps.setter
     def steps(self, value: int) -> None:
         """Set the total number of steps and update dependent properties"""
-        if value != self._steps:
-            old_steps = self._steps
-            self._steps = value
-
-            new_notes = np.full((value, self.max_polyphony), None, dtype=object)
-            new_durations = np.zeros((value, self.max_polyphony), dtype=np.float32)
-            new_amplitudes = np.zeros((value, self.max_polyphony), dtype=np.uint8)
-
-            # Copy old data
-            copy_steps = min(old_steps, value)
-            new_notes[:copy_steps] = self.notes[:copy_steps]
-            new_durations[:copy_steps] = self.durations[:copy_steps]
-            new_amplitudes[:copy_steps] = self.amplitudes[:copy_steps]
-
-            self.notes = new_notes
-            self.durations = new_durations
-            self.amplitudes = new_amplitudes
+        self._resize(value)
 
     def get_sequence_data_for_timeline(self):
-        """Get sequence data in the format expected by timeline scheduling"""
-        # Flatten the polyphonic data for sequencing
-        # This will need to be updated when implementing actual sequencing
-        return {
-            "note": self.notes,
-            "duration": self.durations,
-            "amplitude": self.amplitudes,
-        }
+        """Get sequence data in the format expected by timeline scheduling: one entry per step with
+        a single value for single notes, tuples for chords and None for empty steps.
+        The result is cached until the sequence changes, the lists must not be modified."""
+        if self._sequence_data is None:
+            notes_list = []
+            durations_list = []
+            amplitudes_list = []
+
+            # tolist() converts to Python numbers in one go instead of indexing numpy scalars
+            for step_notes, step_durations, step_amplitudes in zip(
+                self.notes.tolist(), self.durations.tolist(), self.amplitudes.tolist()
+            ):
+                voices = [voice for voice, note in enumerate(step_notes) if note != definitions.NO_NOTE]
+                if not voices:
+                    notes_list.append(None)
+                    durations_list.append(0.25)
+                    amplitudes_list.append(0)
+                elif len(voices) == 1:
+                    notes_list.append(step_notes[voices[0]])
+                    durations_list.append(step_durations[voices[0]])
+                    amplitudes_list.append(step_amplitudes[voices[0]])
+                else:
+                    notes_list.append(tuple(step_notes[voice] for voice in voices))
+                    # Duration is always a single value (use the first duration for all notes of a chord)
+                    durations_list.append(step_durations[voices[0]])
+                    amplitudes_list.append(tuple(step_amplitudes[voice] for voice in voices))
+
+            self._sequence_data = {
+                "note": notes_list,
+                "duration": durations_list,
+                "amplitude": amplitudes_list,
+            }
+        return self._sequence_data
 
     def _reschedule_if_playing(self):
         """Helper method to trigger reschedule if clip is playing"""
         if self.playing:
-            if self.app and hasattr(self.app, "seq"):
-                self.app.seq.schedule_clip(self)
+            app = self.app
+            if app and hasattr(app, "seq"):
+                app.seq.schedule_clip(self)
 
-    def update_playhead_position(self):
+    def update_playhead_position(self, current_time=None):
         """Update the playhead position based on timeline time.
-        Should be called periodically from the main loop.
+        Should be called periodically from the main loop. current_time can be passed
+        when updating many clips at once so the timeline is only queried once.
         """
-        if self.playing and self.app and hasattr(self.app, "global_timeline"):
-            current_time = self.app.global_timeline.current_time
+        if not self.playing:
+            return
+        app = self.app
+        if app and hasattr(app, "global_timeline"):
+            if current_time is None:
+                current_time = app.global_timeline.current_time
             elapsed_beats = current_time - self._playback_start_time
             # If we haven't reached the scheduled start time yet, playhead is at 0
             # Use max(0, ...) to handle negative elapsed (pre-start) correctly
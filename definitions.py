@@ -14,7 +14,16 @@ LAYOUT_RHYTHMIC = 'lrhythmic'
 LAYOUT_SLICES = 'lslices'
 
 NOTIFICATION_TIME = 3
+DISPLAY_IDLE_REFRESH_TIME = 0.5  # Display is redrawn at least this often even if not flagged for update
+DISPLAY_KEEPALIVE_TIME = 1.0  # Unchanged frames are still sent this often, Push turns the display off without frames
 BUTTON_QUICK_PRESS_TIME = 0.400
+REALTIME_PRIORITY = 20  # SCHED_FIFO priority for the main loop when the "realtime_priority" setting is enabled
+FRAME_SPIN_TIME = 0.001  # The main loop sleeps until this long before each frame deadline, then polls the clock
+
+DEBUG_PAD_EVENTS = False  # Print pad press dispatch details (slow, only for debugging)
+DEBUG_FPS = False  # Print the measured frame rate once per second
+DEBUG_ENCODER_EVENTS = False  # Print encoder touch/release events
+DEBUG_MIDI_OUT = False  # Print every note and CC sent to MIDI output devices (slow, only for debugging)
 
 GLOBAL_TIMELINE_MAX_TRACKS = 8
 
@@ -24,6 +33,8 @@ MAX_DEVICE_NAME_CHARS = 20
 GRID_WIDTH = 8
 GRID_HEIGHT = 8
 
+NO_NOTE = -1  # Value of the empty voice slots in Clip.notes
+
 BLACK_RGB = [0, 0, 0]
 GRAY_DARK_RGB = [30, 30, 30]
 GRAY_LIGHT_RGB = [180, 180, 180]
@@ -161,6 +172,7 @@ class PushItMode(object):
 
     def __init__(self, app, settings=None):
         self.app = app
+        self._type_name = type(self).__name__  # used in debug output
         self.encoder_accumulators = {}
         self.initialize(settings=settings)
 
@@ -229,7 +241,7 @@ class PushItMode(object):
 
     # Some update helper methods
     def set_button_color(self, button_name, color=WHITE, animation=ANIMATION_STATIC, animation_end_color=BLACK):
-        self.push.buttons.set_button_color(
+        self.app.set_button_color(
             button_name,
             color,
             animation=animation,
@@ -238,9 +250,9 @@ class PushItMode(object):
 
     def set_button_color_if_pressed(self, button_name, color=WHITE, off_color=OFF_BTN_COLOR, animation=ANIMATION_STATIC, animation_end_color=BLACK):
         if not self.app.is_button_being_pressed(button_name):
-            self.push.buttons.set_button_color(button_name, off_color)
+            self.app.set_button_color(button_name, off_color)
         else:
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 button_name,
                 color,
                 animation=animation,
@@ -251,9 +263,9 @@ class PushItMode(object):
         if also_include_is_pressed:
             expression = expression or self.app.is_button_being_pressed(button_name)
         if not expression:
-            self.push.buttons.set_button_color(button_name, false_color)
+            self.app.set_button_color(button_name, false_color)
         else:
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 button_name,
                 color,
                 animation=animation,
@@ -262,7 +274,7 @@ class PushItMode(object):
 
     def set_buttons_to_color(self, button_names, color=WHITE, animation=ANIMATION_STATIC, animation_end_color=BLACK):
         for button_name in button_names:
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 button_name,
                 color,
                 animation=animation,
@@ -123,19 +123,19 @@ class AddTrackMode(definitions.PushItMode):
             push2_python.constants.BUTTON_UPPER_ROW_7,
             push2_python.constants.BUTTON_UPPER_ROW_8,
         ]:
-            self.push.buttons.set_button_color(button_name, definitions.BLACK)
+            self.app.set_button_color(button_name, definitions.BLACK)
 
     def update_buttons(self):
-        self.push.buttons.set_button_color(
+        self.app.set_button_color(
             push2_python.constants.BUTTON_UPPER_ROW_4, definitions.BLACK
         )
-        self.push.buttons.set_button_color(
+        self.app.set_button_color(
             push2_python.constants.BUTTON_UPPER_ROW_6, definitions.BLACK
         )
-        self.push.buttons.set_button_color(
+        self.app.set_button_color(
             push2_python.constants.BUTTON_UPPER_ROW_7, definitions.GREEN
         )
-        self.push.buttons.set_button_color(
+        self.app.set_button_color(
             push2_python.constants.BUTTON_UPPER_ROW_8, definitions.RED
         )
 
@@ -208,15 +208,16 @@ class ClipEditMode(definitions.PushItMode):
         # duration covers. The first (onset) pad is full brightness; the
         # following pads are dimmed so a sustained note reads as a trail
         # rather than as multiple consecutive notes.
-        for note_data in notes_to_render:
-            pad_i = note_data["pad_i"]
-            duration_steps = note_data["duration_steps"]
-
+        for pad_i, note_pad_j, duration_steps in zip(
+            notes_to_render["pad_i"].tolist(),
+            notes_to_render["pad_j"].tolist(),
+            notes_to_render["duration_steps"].tolist(),
+        ):
             if not (0 <= pad_i < definitions.GRID_WIDTH):
                 continue
 
             for step_offset in range(duration_steps):
-                pad_j = note_data["pad_j"] + step_offset
+                pad_j = note_pad_j + step_offset
                 if not (0 <= pad_j < definitions.GRID_HEIGHT):
                     break
                 if step_offset == 0:
@@ -380,9 +381,7 @@ class ClipEditMode(definitions.PushItMode):
         print("DEBUG: ClipEditMode.activate() called")
         # Clear the display to hide previous interface
         if self.app.use_push2_display:
-            self.push.display.send_to_display(
-                self.push.display.prepare_frame(self.push.display.make_black_frame())
-            )
+            self.app.clear_display()
 
         self.update_buttons()
         self.update_pads()
@@ -395,39 +394,39 @@ class ClipEditMode(definitions.PushItMode):
                 self.available_clips.append(clip)
 
     def deactivate(self):
-        self.app.push.pads.set_all_pads_to_color(color=definitions.BLACK)
+        self.app.set_all_pads_to_color(color=definitions.BLACK)
         for button_name in self.buttons_used:
-            self.push.buttons.set_button_color(button_name, definitions.BLACK)
+            self.app.set_button_color(button_name, definitions.BLACK)
 
     def update_buttons(self):
         if self.mode == self.MODE_CLIP:
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_SHIFT, definitions.WHITE
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_UPPER_ROW_2, definitions.BLACK
             )
             self.set_button_color_if_pressed(
                 push2_python.constants.BUTTON_UPPER_ROW_3,
                 animation=definitions.DEFAULT_ANIMATION,
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_UPPER_ROW_4, definitions.WHITE
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_UPPER_ROW_5, definitions.BLACK
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_UPPER_ROW_6, definitions.BLACK
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_UPPER_ROW_7, definitions.BLACK
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_UPPER_ROW_8, definitions.BLACK
             )
 
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_CLIP, definitions.OFF_BTN_COLOR
             )
 
@@ -447,17 +446,17 @@ class ClipEditMode(definitions.PushItMode):
             if self.clip is not None:
                 if self.clip.recording or self.clip.will_start_recording_at > -1.0:
                     if self.clip.recording:
-                        self.push.buttons.set_button_color(
+                        self.app.set_button_color(
                             push2_python.constants.BUTTON_RECORD, definitions.RED
                         )
                     else:
-                        self.push.buttons.set_button_color(
+                        self.app.set_button_color(
                             push2_python.constants.BUTTON_RECORD,
                             definitions.RED,
                             animation=definitions.DEFAULT_ANIMATION,
                         )
                 else:
-                    self.push.buttons.set_button_color(
+                    self.app.set_button_color(
                         push2_python.constants.BUTTON_RECORD, definitions.WHITE
                     )
 
@@ -465,58 +464,58 @@ class ClipEditMode(definitions.PushItMode):
                 track_color = self.app.track_selection_mode.get_track_color(track_idx)
                 if self.clip.playing or self.clip.will_play_at > -1.0:
                     if self.clip.playing:
-                        self.push.buttons.set_button_color(
+                        self.app.set_button_color(
                             push2_python.constants.BUTTON_UPPER_ROW_1, track_color
                         )
                     else:
-                        self.push.buttons.set_button_color(
+                        self.app.set_button_color(
                             push2_python.constants.BUTTON_UPPER_ROW_1,
                             track_color,
                             animation=definitions.DEFAULT_ANIMATION,
                         )
                 else:
-                    self.push.buttons.set_button_color(
+                    self.app.set_button_color(
                         push2_python.constants.BUTTON_UPPER_ROW_1,
                         track_color + "_darker1",
                     )
 
         elif self.mode == self.MODE_EVENT:
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_UPPER_ROW_1, definitions.BLACK
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_UPPER_ROW_2, definitions.BLACK
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_UPPER_ROW_3, definitions.BLACK
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_UPPER_ROW_4, definitions.BLACK
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_UPPER_ROW_5, definitions.BLACK
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_UPPER_ROW_6, definitions.BLACK
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_UPPER_ROW_7, definitions.BLACK
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_UPPER_ROW_8, definitions.BLACK
             )
 
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_DOUBLE_LOOP, definitions.BLACK
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_QUANTIZE, definitions.BLACK
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_DELETE, definitions.BLACK
             )
 
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_CLIP, definitions.BLACK
             )
 
@@ -525,56 +524,56 @@ class ClipEditMode(definitions.PushItMode):
                 push2_python.constants.BUTTON_UPPER_ROW_1,
                 animation=definitions.DEFAULT_ANIMATION,
             )  # generate sequence button
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_UPPER_ROW_2, definitions.BLACK
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_UPPER_ROW_3, definitions.BLACK
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_UPPER_ROW_4, definitions.BLACK
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_UPPER_ROW_5, definitions.BLACK
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_UPPER_ROW_6, definitions.BLACK
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_UPPER_ROW_7, definitions.BLACK
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_UPPER_ROW_8, definitions.BLACK
             )
 
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_DOUBLE_LOOP, definitions.BLACK
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_QUANTIZE, definitions.BLACK
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_DELETE, definitions.BLACK
             )
 
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_CLIP, definitions.WHITE
             )
 
         if self.mode == self.MODE_CLIP or self.mode == self.MODE_EVENT:
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_OCTAVE_UP, definitions.WHITE
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_OCTAVE_DOWN, definitions.WHITE
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_PAGE_LEFT, definitions.WHITE
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_PAGE_RIGHT, definitions.WHITE
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_SHIFT, definitions.WHITE
             )
 
@@ -582,7 +581,7 @@ class ClipEditMode(definitions.PushItMode):
         if self.clip is None:
             return
         color_matrix, animation_matrix = self.render_pads()
-        self.push.pads.set_pads_color(color_matrix, animation_matrix)
+        self.app.set_pads_color(color_matrix, animation_matrix)
 
     def on_button_pressed(self, button_name):
         # Window navigation for all modes - handle first
@@ -183,7 +183,7 @@ class ClipTriggeringMode(definitions.PushItMode):
 
     def deactivate(self):
         for button_name in self.upper_row_buttons:
-            self.push.buttons.set_button_color(button_name, definitions.BLACK)
+            self.app.set_button_color(button_name, definitions.BLACK)
 
     def new_track_selected(self):
         self.app.pads_need_update = True
@@ -307,7 +307,7 @@ class ClipTriggeringMode(definitions.PushItMode):
                         color_matrix[c][t] = definitions.RED
                         animation_matrix[c][t] = definitions.FAST_ANIMATION
 
-        self.push.pads.set_pads_color(color_matrix, animation_matrix)
+        self.app.set_pads_color(color_matrix, animation_matrix)
 
     def on_button_pressed(self, button_name):
         if button_name in self.scene_trigger_buttons:
@@ -24,82 +24,78 @@ class MainControlsMode(definitions.PushItMode):
         self.update_buttons()
 
     def deactivate(self):
-        self.push.buttons.set_button_color(MELODIC_RHYTHMIC_TOGGLE_BUTTON, definitions.BLACK)
-        self.push.buttons.set_button_color(TOGGLE_DISPLAY_BUTTON, definitions.BLACK)
-        self.push.buttons.set_button_color(SETTINGS_BUTTON, definitions.BLACK)
-        self.push.buttons.set_button_color(PRESET_SELECTION_MODE_BUTTON, definitions.BLACK)
-        self.push.buttons.set_button_color(METRONOME_BUTTON, definitions.BLACK)
-        self.push.buttons.set_button_color(push2_python.constants.BUTTON_SCALE, definitions.BLACK)
-        self.push.buttons.set_button_color(RECORD_BUTTON, definitions.BLACK)
+        self.app.set_button_color(MELODIC_RHYTHMIC_TOGGLE_BUTTON, definitions.BLACK)
+        self.app.set_button_color(TOGGLE_DISPLAY_BUTTON, definitions.BLACK)
+        self.app.set_button_color(SETTINGS_BUTTON, definitions.BLACK)
+        self.app.set_button_color(PRESET_SELECTION_MODE_BUTTON, definitions.BLACK)
+        self.app.set_button_color(METRONOME_BUTTON, definitions.BLACK)
+        self.app.set_button_color(push2_python.constants.BUTTON_SCALE, definitions.BLACK)
+        self.app.set_button_color(RECORD_BUTTON, definitions.BLACK)
 
     def update_buttons(self):
         # Note button, to toggle melodic/rhythmic mode
-        self.push.buttons.set_button_color(MELODIC_RHYTHMIC_TOGGLE_BUTTON, definitions.WHITE)
+        self.app.set_button_color(MELODIC_RHYTHMIC_TOGGLE_BUTTON, definitions.WHITE)
 
         # Mute button, to toggle display on/off
         if self.app.use_push2_display:
-            self.push.buttons.set_button_color(TOGGLE_DISPLAY_BUTTON, definitions.WHITE)
+            self.app.set_button_color(TOGGLE_DISPLAY_BUTTON, definitions.WHITE)
         else:
-            self.push.buttons.set_button_color(TOGGLE_DISPLAY_BUTTON, definitions.OFF_BTN_COLOR)
+            self.app.set_button_color(TOGGLE_DISPLAY_BUTTON, definitions.OFF_BTN_COLOR)
 
         # Settings button, to toggle settings mode
         if self.app.is_mode_active(self.app.settings_mode):
-            self.push.buttons.set_button_color(SETTINGS_BUTTON, definitions.BLACK)
-            self.push.buttons.set_button_color(SETTINGS_BUTTON, definitions.WHITE, animation=definitions.DEFAULT_ANIMATION)
+            self.app.set_button_color(SETTINGS_BUTTON, definitions.WHITE, animation=definitions.DEFAULT_ANIMATION, force=True)
         else:
-            self.push.buttons.set_button_color(SETTINGS_BUTTON, definitions.WHITE)
+            self.app.set_button_color(SETTINGS_BUTTON, definitions.WHITE)
 
         # Scale button, to toggle scale mode
         if self.app.is_mode_active(self.app.scale_mode):
-            self.push.buttons.set_button_color(push2_python.constants.BUTTON_SCALE, definitions.BLACK)
-            self.push.buttons.set_button_color(push2_python.constants.BUTTON_SCALE, definitions.WHITE, animation=definitions.DEFAULT_ANIMATION)
+            self.app.set_button_color(push2_python.constants.BUTTON_SCALE, definitions.WHITE, animation=definitions.DEFAULT_ANIMATION, force=True)
         else:
-            self.push.buttons.set_button_color(push2_python.constants.BUTTON_SCALE, definitions.WHITE)
+            self.app.set_button_color(push2_python.constants.BUTTON_SCALE, definitions.WHITE)
 
         # Clip triggering mode button
         if self.app.is_mode_active(self.app.clip_triggering_mode):
-            self.push.buttons.set_button_color(CLIP_TRIGGERING_MODE_BUTTON, definitions.BLACK)
-            self.push.buttons.set_button_color(CLIP_TRIGGERING_MODE_BUTTON, definitions.WHITE, animation=definitions.DEFAULT_ANIMATION)
+            self.app.set_button_color(CLIP_TRIGGERING_MODE_BUTTON, definitions.WHITE, animation=definitions.DEFAULT_ANIMATION, force=True)
         else:
-            self.push.buttons.set_button_color(CLIP_TRIGGERING_MODE_BUTTON, definitions.WHITE)
+            self.app.set_button_color(CLIP_TRIGGERING_MODE_BUTTON, definitions.WHITE)
 
         # Preset selection mode
         if self.app.is_mode_active(self.app.preset_selection_mode):
-            self.push.buttons.set_button_color(PRESET_SELECTION_MODE_BUTTON, definitions.BLACK)
-            self.push.buttons.set_button_color(PRESET_SELECTION_MODE_BUTTON, definitions.WHITE, animation=definitions.DEFAULT_ANIMATION)
+            self.app.set_button_color(PRESET_SELECTION_MODE_BUTTON, definitions.WHITE, animation=definitions.DEFAULT_ANIMATION, force=True)
         else:
-            self.push.buttons.set_button_color(PRESET_SELECTION_MODE_BUTTON, definitions.OFF_BTN_COLOR)
+            self.app.set_button_color(PRESET_SELECTION_MODE_BUTTON, definitions.OFF_BTN_COLOR)
 
         # Play button
         if self.app.global_timeline.is_running:
-            self.push.buttons.set_button_color(PLAY_BUTTON, definitions.GREEN, animation=definitions.DEFAULT_ANIMATION)
+            self.app.set_button_color(PLAY_BUTTON, definitions.GREEN, animation=definitions.DEFAULT_ANIMATION)
         else:
-            self.push.buttons.set_button_color(PLAY_BUTTON, definitions.WHITE)
+            self.app.set_button_color(PLAY_BUTTON, definitions.WHITE)
 
         # Metronome button — green when on, red when off
         if self.app.is_metronome_enabled():
-            self.push.buttons.set_button_color(METRONOME_BUTTON, definitions.WHITE, animation=definitions.DEFAULT_ANIMATION)
+            self.app.set_button_color(METRONOME_BUTTON, definitions.WHITE, animation=definitions.DEFAULT_ANIMATION)
         else:
-            self.push.buttons.set_button_color(METRONOME_BUTTON, definitions.OFF_BTN_COLOR)
+            self.app.set_button_color(METRONOME_BUTTON, definitions.OFF_BTN_COLOR)
 
         # Record button — bright red (capturing), dim red (armed, not yet
         # capturing), white when disarmed.
         if self.app.is_recording_armed:
             if self.app.global_timeline.is_running:
                 # Armed + timeline running = actively capturing
-                self.push.buttons.set_button_color(
+                self.app.set_button_color(
                     RECORD_BUTTON, definitions.RED, animation=definitions.DEFAULT_ANIMATION
                 )
             else:
                 # Armed but timeline stopped = waiting to capture
-                self.push.buttons.set_button_color(RECORD_BUTTON, definitions.RED + "_darker1")
+                self.app.set_button_color(RECORD_BUTTON, definitions.RED + "_darker1")
         elif self.app.awaiting_buffer_slot:
             # Prompting the user to save the captured buffer
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 RECORD_BUTTON, definitions.RED, animation=definitions.FAST_ANIMATION
             )
         else:
-            self.push.buttons.set_button_color(RECORD_BUTTON, definitions.WHITE)
+            self.app.set_button_color(RECORD_BUTTON, definitions.WHITE)
 
     def on_button_pressed(self, button_name):
         if button_name == MELODIC_RHYTHMIC_TOGGLE_BUTTON:
@@ -117,7 +113,7 @@ class MainControlsMode(definitions.PushItMode):
         elif button_name == TOGGLE_DISPLAY_BUTTON:
             self.app.use_push2_display = not self.app.use_push2_display
             if not self.app.use_push2_display:
-                self.push.display.send_to_display(self.push.display.prepare_frame(self.push.display.make_black_frame()))
+                self.app.clear_display()
             self.app.buttons_need_update = True
             return True
         elif button_name == CLIP_TRIGGERING_MODE_BUTTON:
@@ -135,7 +131,7 @@ class MainControlsMode(definitions.PushItMode):
             else:
                 # Activate preset selection mode and store time button pressed
                 self.app.set_preset_selection_mode()
-                self.preset_selection_button_pressing_time = time.time()
+                self.preset_selection_button_pressing_time = time.monotonic()
             self.app.buttons_need_update = True
             return True
         elif button_name == METRONOME_BUTTON:
@@ -194,7 +190,7 @@ class MainControlsMode(definitions.PushItMode):
                 # Consider quick press (this should not happen pressing time should have been set before)
                 pass
             else:
-                if time.time() - pressing_time > definitions.BUTTON_QUICK_PRESS_TIME:
+                if time.monotonic() - pressing_time > definitions.BUTTON_QUICK_PRESS_TIME:
                     # Consider this is a long press
                     is_long_press = True
                 self.preset_selection_button_pressing_time = None
@@ -64,7 +64,7 @@ class MelodicMode(definitions.PushItMode):
         elif value >= self.channel_at_range_end:
             value = self.channel_at_range_end - 1
         self.channel_at_range_start = value
-        self.last_time_at_params_edited = time.time()
+        self.last_time_at_params_edited = time.monotonic()
 
     def set_channel_at_range_end(self, value):
         # Parameter in range [channel_at_range_start + 1, 2000]
@@ -73,7 +73,7 @@ class MelodicMode(definitions.PushItMode):
         elif value > 2000:
             value = 2000
         self.channel_at_range_end = value
-        self.last_time_at_params_edited = time.time()
+        self.last_time_at_params_edited = time.monotonic()
 
     def set_poly_at_max_range(self, value):
         # Parameter in range [0, 127]
@@ -82,7 +82,7 @@ class MelodicMode(definitions.PushItMode):
         elif value > 127:
             value = 127
         self.poly_at_max_range = value
-        self.last_time_at_params_edited = time.time()
+        self.last_time_at_params_edited = time.monotonic()
 
     def set_poly_at_curve_bending(self, value):
         # Parameter in range [0, 100]
@@ -91,7 +91,7 @@ class MelodicMode(definitions.PushItMode):
         elif value > 100:
             value = 100
         self.poly_at_curve_bending = value
-        self.last_time_at_params_edited = time.time()
+        self.last_time_at_params_edited = time.monotonic()
 
     def get_poly_at_curve(self):
         pow_curve = [
@@ -182,23 +182,23 @@ class MelodicMode(definitions.PushItMode):
         self.update_pads()
 
     def deactivate(self):
-        self.push.buttons.set_button_color(
+        self.app.set_button_color(
             push2_python.constants.BUTTON_OCTAVE_DOWN, definitions.BLACK
         )
-        self.push.buttons.set_button_color(
+        self.app.set_button_color(
             push2_python.constants.BUTTON_OCTAVE_UP, definitions.BLACK
         )
-        self.push.buttons.set_button_color(
+        self.app.set_button_color(
             push2_python.constants.BUTTON_ACCENT, definitions.BLACK
         )
-        self.push.buttons.set_button_color(
+        self.app.set_button_color(
             push2_python.constants.BUTTON_SHIFT, definitions.BLACK
         )
 
     def check_for_delayed_actions(self):
         if (
             self.last_time_at_params_edited is not None
-            and time.time() - self.last_time_at_params_edited
+            and time.monotonic() - self.last_time_at_params_edited
             > definitions.DELAYED_ACTIONS_APPLY_TIME
         ):
             # Update channel and poly AT parameters
@@ -221,40 +221,36 @@ class MelodicMode(definitions.PushItMode):
         self.app.pads_need_update = True
 
     def update_octave_buttons(self):
-        self.push.buttons.set_button_color(
+        self.app.set_button_color(
             push2_python.constants.BUTTON_OCTAVE_DOWN, definitions.WHITE
         )
-        self.push.buttons.set_button_color(
+        self.app.set_button_color(
             push2_python.constants.BUTTON_OCTAVE_UP, definitions.WHITE
         )
 
     def update_accent_button(self):
         if self.fixed_velocity_mode:
-            self.push.buttons.set_button_color(
-                push2_python.constants.BUTTON_ACCENT, definitions.BLACK
-            )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_ACCENT,
                 definitions.WHITE,
                 animation=definitions.DEFAULT_ANIMATION,
+                force=True,
             )
         else:
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_ACCENT, definitions.OFF_BTN_COLOR
             )
 
     def update_modulation_wheel_mode_button(self):
         if self.modulation_wheel_mode:
-            self.push.buttons.set_button_color(
-                push2_python.constants.BUTTON_SHIFT, definitions.BLACK
-            )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_SHIFT,
                 definitions.WHITE,
                 animation=definitions.DEFAULT_ANIMATION,
+                force=True,
             )
         else:
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_SHIFT, definitions.OFF_BTN_COLOR
             )
 
@@ -285,12 +281,12 @@ class MelodicMode(definitions.PushItMode):
                 row_colors.append(cell_color)
             color_matrix.append(row_colors)
 
-        self.push.pads.set_pads_color(color_matrix)
+        self.app.set_pads_color(color_matrix)
 
     def on_pad_pressed(self, pad_n, pad_ij, velocity):
         midi_note = self.pad_ij_to_midi_note(pad_ij)
         if midi_note is not None:
-            self.latest_velocity_value = (time.time(), velocity)
+            self.latest_velocity_value = (time.monotonic(), velocity)
             if (
                 self.app.track_selection_mode.get_current_track_info().get(
                     "illuminate_local_notes", True
@@ -323,7 +319,8 @@ class MelodicMode(definitions.PushItMode):
 
     def on_pad_released(self, pad_n, pad_ij, velocity):
         midi_note = self.pad_ij_to_midi_note(pad_ij)
-        print(f"PAD RELEASED: note={midi_note}")
+        if definitions.DEBUG_PAD_EVENTS:
+            print(f"PAD RELEASED: note={midi_note}")
         if midi_note is not None:
             if (
                 self.app.track_selection_mode.get_current_track_info().get(
@@ -85,7 +85,7 @@ class MetronomeMode(definitions.PushItMode):
             push2_python.constants.BUTTON_LOWER_ROW_5,
             push2_python.constants.BUTTON_LOWER_ROW_8
         ]:
-            self.push.buttons.set_button_color(button_name, definitions.BLACK)
+            self.app.set_button_color(button_name, definitions.BLACK)
 
     def update_buttons(self):
         # clear lower row
@@ -100,42 +100,42 @@ class MetronomeMode(definitions.PushItMode):
             push2_python.constants.BUTTON_LOWER_ROW_7,
             push2_python.constants.BUTTON_LOWER_ROW_8
         ]:
-            self.push.buttons.set_button_color(button_name, definitions.BLACK)
+            self.app.set_button_color(button_name, definitions.BLACK)
 
         if self.accent_note_selected is True:
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_UPPER_ROW_5, definitions.WHITE
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_LOWER_ROW_5, definitions.BLACK
             )
         else:
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_UPPER_ROW_5, definitions.BLACK
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_LOWER_ROW_5, definitions.WHITE
             )
 
         if self.accent_velocity_selected is True:
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_UPPER_ROW_6, definitions.WHITE
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_LOWER_ROW_6, definitions.BLACK
             )
         else:
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_UPPER_ROW_6, definitions.BLACK
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_LOWER_ROW_6, definitions.WHITE
             )
 
-        self.push.buttons.set_button_color(
+        self.app.set_button_color(
             push2_python.constants.BUTTON_UPPER_ROW_8, definitions.GREEN
         )
-        self.push.buttons.set_button_color(
+        self.app.set_button_color(
             push2_python.constants.BUTTON_LOWER_ROW_8, definitions.RED
         )
 
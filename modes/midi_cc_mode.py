@@ -278,26 +278,26 @@ class MIDICCMode(PushItMode):
 
     def deactivate(self):
         for button_name in self.midi_cc_button_names + [push2_python.constants.BUTTON_PAGE_LEFT, push2_python.constants.BUTTON_PAGE_RIGHT]:
-            self.push.buttons.set_button_color(button_name, definitions.BLACK)
+            self.app.set_button_color(button_name, definitions.BLACK)
 
     def update_buttons(self):
 
         n_midi_cc_sections = len(self.get_current_track_midi_cc_sections())
         for count, name in enumerate(self.midi_cc_button_names):
             if count < n_midi_cc_sections:
-                self.push.buttons.set_button_color(name, definitions.WHITE)
+                self.app.set_button_color(name, definitions.WHITE)
             else:
-                self.push.buttons.set_button_color(name, definitions.BLACK)
+                self.app.set_button_color(name, definitions.BLACK)
 
         show_prev, show_next = self.get_should_show_midi_cc_next_prev_pages_for_section()
         if show_prev:
-            self.push.buttons.set_button_color(push2_python.constants.BUTTON_PAGE_LEFT, definitions.WHITE)
+            self.app.set_button_color(push2_python.constants.BUTTON_PAGE_LEFT, definitions.WHITE)
         else:
-            self.push.buttons.set_button_color(push2_python.constants.BUTTON_PAGE_LEFT, definitions.BLACK)
+            self.app.set_button_color(push2_python.constants.BUTTON_PAGE_LEFT, definitions.BLACK)
         if show_next:
-            self.push.buttons.set_button_color(push2_python.constants.BUTTON_PAGE_RIGHT, definitions.WHITE)
+            self.app.set_button_color(push2_python.constants.BUTTON_PAGE_RIGHT, definitions.WHITE)
         else:
-            self.push.buttons.set_button_color(push2_python.constants.BUTTON_PAGE_RIGHT, definitions.BLACK)
+            self.app.set_button_color(push2_python.constants.BUTTON_PAGE_RIGHT, definitions.BLACK)
 
     def update_display(self, ctx, w, h):
 
@@ -124,20 +124,20 @@ class PresetSelectionMode(definitions.PushItMode):
 
 
     def deactivate(self):
-        self.app.push.pads.set_all_pads_to_color(color=definitions.BLACK)
-        self.push.buttons.set_button_color(push2_python.constants.BUTTON_LEFT, definitions.BLACK)
-        self.push.buttons.set_button_color(push2_python.constants.BUTTON_RIGHT, definitions.BLACK)
+        self.app.set_all_pads_to_color(color=definitions.BLACK)
+        self.app.set_button_color(push2_python.constants.BUTTON_LEFT, definitions.BLACK)
+        self.app.set_button_color(push2_python.constants.BUTTON_RIGHT, definitions.BLACK)
 
     def update_buttons(self):
         show_prev, show_next = self.has_prev_next_pages()
         if show_prev:
-            self.push.buttons.set_button_color(push2_python.constants.BUTTON_LEFT, definitions.WHITE)
+            self.app.set_button_color(push2_python.constants.BUTTON_LEFT, definitions.WHITE)
         else:
-            self.push.buttons.set_button_color(push2_python.constants.BUTTON_LEFT, definitions.BLACK)
+            self.app.set_button_color(push2_python.constants.BUTTON_LEFT, definitions.BLACK)
         if show_next:
-            self.push.buttons.set_button_color(push2_python.constants.BUTTON_RIGHT, definitions.WHITE)
+            self.app.set_button_color(push2_python.constants.BUTTON_RIGHT, definitions.WHITE)
         else:
-            self.push.buttons.set_button_color(push2_python.constants.BUTTON_RIGHT, definitions.BLACK)
+            self.app.set_button_color(push2_python.constants.BUTTON_RIGHT, definitions.BLACK)
 
     def update_pads(self):
         track_color = self.app.track_selection_mode.get_current_track_color() 
@@ -151,11 +151,11 @@ class PresetSelectionMode(definitions.PushItMode):
                     cell_color = f'{cell_color}_darker2'  # If preset not in favourites, use a darker version of the track color
                 row_colors.append(cell_color)
             color_matrix.append(row_colors)
-        self.push.pads.set_pads_color(color_matrix)
+        self.app.set_pads_color(color_matrix)
 
     def on_pad_pressed(self, pad_n, pad_ij, velocity):
-        self.pad_pressing_states[pad_n] = time.time()  # Store time at which pad_n was pressed
-        self.push.pads.set_pad_color(pad_ij, color=definitions.GREEN)
+        self.pad_pressing_states[pad_n] = time.monotonic()  # Store time at which pad_n was pressed
+        self.app.set_pad_color(pad_ij, color=definitions.GREEN)
         return True  # Prevent other modes to get this event
 
     def on_pad_released(self, pad_n, pad_ij, velocity):
@@ -165,7 +165,7 @@ class PresetSelectionMode(definitions.PushItMode):
             # Consider quick press (this should not happen as self.pad_pressing_states[pad_n] should have been set before)
             pass
         else:
-            if time.time() - pressing_time > self.pad_quick_press_time:
+            if time.monotonic() - pressing_time > self.pad_quick_press_time:
                 # Consider this is a long press
                 is_long_press = True
             self.pad_pressing_states[pad_n] = None  # Reset pressing time to none
@@ -50,7 +50,7 @@ class RhythmicMode(MelodicMode):
                 row_colors.append(cell_color)
             color_matrix.append(row_colors)
 
-        self.push.pads.set_pads_color(color_matrix)
+        self.app.set_pads_color(color_matrix)
 
     def on_button_pressed(self, button_name):
         if button_name == push2_python.constants.BUTTON_OCTAVE_UP or button_name == push2_python.constants.BUTTON_OCTAVE_DOWN:
@@ -238,18 +238,18 @@ class ScaleMode(definitions.PushItMode):
 
     def update_buttons(self):
         # Turn off unused buttons
-        self.push.buttons.set_button_color(
+        self.app.set_button_color(
             push2_python.constants.BUTTON_UPPER_ROW_1, definitions.OFF_BTN_COLOR
         )
-        self.push.buttons.set_button_color(
+        self.app.set_button_color(
             push2_python.constants.BUTTON_UPPER_ROW_8, definitions.BLACK
         )
-        self.push.buttons.set_button_color(
+        self.app.set_button_color(
             push2_python.constants.BUTTON_LOWER_ROW_8, definitions.BLACK
         )
 
         # Init key/chromatic button
-        self.push.buttons.set_button_color(
+        self.app.set_button_color(
             push2_python.constants.BUTTON_LOWER_ROW_1, definitions.WHITE
         )
 
@@ -260,13 +260,13 @@ class ScaleMode(definitions.PushItMode):
                 definitions.WHITE if self.selected_key == key else definitions.GRAY_DARK
             )
             btn = getattr(push2_python.constants, f"BUTTON_UPPER_ROW_{idx + 2}")
-            self.push.buttons.set_button_color(btn, color)
+            self.app.set_button_color(btn, color)
         for idx, key in enumerate(lower_keys):
             color = (
                 definitions.WHITE if self.selected_key == key else definitions.GRAY_DARK
             )
             btn = getattr(push2_python.constants, f"BUTTON_LOWER_ROW_{idx + 2}")
-            self.push.buttons.set_button_color(btn, color)
+            self.app.set_button_color(btn, color)
 
     def _draw_key_labels(self, ctx, w, h):
         upper_keys = ["C", "G", "D", "A", "E", "B"]
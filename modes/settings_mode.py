@@ -71,7 +71,7 @@ class SettingsMode(definitions.PushItMode):
     def initialize(self, settings=None):
         if settings is None:
             settings = {}
-        current_time = time.time()
+        current_time = time.monotonic()
         for encoder_name in self.push.encoders.available_names:
             self.encoders_state[encoder_name] = {
                 'last_message_received': current_time,
@@ -132,7 +132,7 @@ class SettingsMode(definitions.PushItMode):
         if len(item) <= self.project_list.max_width_before_scroll:
             return item
 
-        current_time = time.time()
+        current_time = time.monotonic()
         if current_time - self.project_list.last_scroll_time > self.project_list.pause_before_scroll:
             self.project_list.scroll_text_offset += self.project_list.scroll_text_direction
 
@@ -146,19 +146,19 @@ class SettingsMode(definitions.PushItMode):
         return display_text
 
     def deactivate(self):
-        self.push.buttons.set_button_color(push2_python.constants.BUTTON_UPPER_ROW_1, definitions.BLACK)
-        self.push.buttons.set_button_color(push2_python.constants.BUTTON_UPPER_ROW_2, definitions.BLACK)
-        self.push.buttons.set_button_color(push2_python.constants.BUTTON_UPPER_ROW_3, definitions.BLACK)
-        self.push.buttons.set_button_color(push2_python.constants.BUTTON_UPPER_ROW_4, definitions.BLACK)
-        self.push.buttons.set_button_color(push2_python.constants.BUTTON_UPPER_ROW_5, definitions.BLACK)
-        self.push.buttons.set_button_color(push2_python.constants.BUTTON_UPPER_ROW_6, definitions.BLACK)
-        self.push.buttons.set_button_color(push2_python.constants.BUTTON_UPPER_ROW_7, definitions.BLACK)
-        self.push.buttons.set_button_color(push2_python.constants.BUTTON_UPPER_ROW_8, definitions.BLACK)
-        self.push.buttons.set_button_color(push2_python.constants.BUTTON_LOWER_ROW_1, definitions.BLACK)
-        self.push.buttons.set_button_color(push2_python.constants.BUTTON_LOWER_ROW_2, definitions.BLACK)
-        self.push.buttons.set_button_color(push2_python.constants.BUTTON_LOWER_ROW_3, definitions.BLACK)
-        self.push.buttons.set_button_color(push2_python.constants.BUTTON_UP, definitions.BLACK)
-        self.push.buttons.set_button_color(push2_python.constants.BUTTON_DOWN, definitions.BLACK)
+        self.app.set_button_color(push2_python.constants.BUTTON_UPPER_ROW_1, definitions.BLACK)
+        self.app.set_button_color(push2_python.constants.BUTTON_UPPER_ROW_2, definitions.BLACK)
+        self.app.set_button_color(push2_python.constants.BUTTON_UPPER_ROW_3, definitions.BLACK)
+        self.app.set_button_color(push2_python.constants.BUTTON_UPPER_ROW_4, definitions.BLACK)
+        self.app.set_button_color(push2_python.constants.BUTTON_UPPER_ROW_5, definitions.BLACK)
+        self.app.set_button_color(push2_python.constants.BUTTON_UPPER_ROW_6, definitions.BLACK)
+        self.app.set_button_color(push2_python.constants.BUTTON_UPPER_ROW_7, definitions.BLACK)
+        self.app.set_button_color(push2_python.constants.BUTTON_UPPER_ROW_8, definitions.BLACK)
+        self.app.set_button_color(push2_python.constants.BUTTON_LOWER_ROW_1, definitions.BLACK)
+        self.app.set_button_color(push2_python.constants.BUTTON_LOWER_ROW_2, definitions.BLACK)
+        self.app.set_button_color(push2_python.constants.BUTTON_LOWER_ROW_3, definitions.BLACK)
+        self.app.set_button_color(push2_python.constants.BUTTON_UP, definitions.BLACK)
+        self.app.set_button_color(push2_python.constants.BUTTON_DOWN, definitions.BLACK)
         self.current_page = 0
         self.setup_button_pressing_time = None
 
@@ -167,93 +167,93 @@ class SettingsMode(definitions.PushItMode):
         self.modified_tracks = set()
 
     def update_buttons(self):
-        self.push.buttons.set_button_color(
+        self.app.set_button_color(
             push2_python.constants.BUTTON_LOWER_ROW_1, definitions.WHITE
         )
-        self.push.buttons.set_button_color(
+        self.app.set_button_color(
             push2_python.constants.BUTTON_LOWER_ROW_2, definitions.WHITE
         )
-        self.push.buttons.set_button_color(
+        self.app.set_button_color(
             push2_python.constants.BUTTON_LOWER_ROW_3, definitions.WHITE
         )
 
         if self.current_page == Pages.PERFORMANCE:
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_UPPER_ROW_1, definitions.WHITE
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_UPPER_ROW_2, definitions.OFF_BTN_COLOR
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_UPPER_ROW_3, definitions.OFF_BTN_COLOR
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_UPPER_ROW_4, definitions.OFF_BTN_COLOR
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_UPPER_ROW_5, definitions.OFF_BTN_COLOR
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_UPPER_ROW_6, definitions.BLACK
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_UPPER_ROW_7, definitions.BLACK
             )
-            self.push.buttons.set_button_color(
+            self.app.set_button_color(
                 push2_python.constants.BUTTON_UPPER_ROW_8, definitions.BLACK
             )
 
         elif self.current_page == Pages.SESSION:
-            self.push.buttons.set_button_color( # Last session on boot
+            self.app.set_button_color( # Last session on boot
                 push2_python.constants.BUTTON_UPPER_ROW_1, definitions.WHITE
             )
-            self.push.buttons.set_button_color( # Save settings
+            self.app.set_button_color( # Save settings
                 push2_python.constants.BUTTON_UPPER_ROW_3, definitions.GREEN
             )
-            self.push.buttons.set_button_color( # Empty
+            self.app.set_button_color( # Empty
                 push2_python.constants.BUTTON_UPPER_ROW_4, definitions.BLACK
             )
-            self.push.buttons.set_button_color( # Empty
+            self.app.set_button_color( # Empty
                 push2_python.constants.BUTTON_UPPER_ROW_5, definitions.BLACK
             )
-            self.push.buttons.set_button_color( # Reset MIDI
+            self.app.set_button_color( # Reset MIDI
                 push2_python.constants.BUTTON_UPPER_ROW_6,
                 definitions.GREEN,
                 animation=definitions.DEFAULT_ANIMATION
             )
-            self.push.buttons.set_button_color( # Software Update
+            self.app.set_button_color( # Software Update
                 push2_python.constants.BUTTON_UPPER_ROW_7,
                 definitions.RED,
                 animation=definitions.DEFAULT_ANIMATION
             )
-            self.push.buttons.set_button_color( # Restart
+            self.app.set_button_color( # Restart
                 push2_python.constants.BUTTON_UPPER_ROW_8,
                 definitions.RED,
                 animation=definitions.DEFAULT_ANIMATION
             )
         elif self.current_page == Pages.PROJECT:
-            self.push.buttons.set_button_color( # Save session
+            self.app.set_button_color( # Save session
                 push2_python.constants.BUTTON_UPPER_ROW_1, definitions.WHITE
             )
-            self.push.buttons.set_button_color( # Empty
+            self.app.set_button_color( # Empty
                 push2_python.constants.BUTTON_UPPER_ROW_2, definitions.BLACK
             )
-            self.push.buttons.set_button_color( # Load session
+            self.app.set_button_color( # Load session
                 push2_python.constants.BUTTON_UPPER_ROW_3, definitions.WHITE
             )
-            self.push.buttons.set_button_color( # Empty
+            self.app.set_button_color( # Empty
                 push2_python.constants.BUTTON_UPPER_ROW_4, definitions.BLACK
             )
-            self.push.buttons.set_button_color( # Empty
+            self.app.set_button_color( # Empty
                 push2_python.constants.BUTTON_UPPER_ROW_5, definitions.BLACK
             )
-            self.push.buttons.set_button_color( # Empty
+            self.app.set_button_color( # Empty
                 push2_python.constants.BUTTON_UPPER_ROW_6, definitions.BLACK
             )
-            self.push.buttons.set_button_color( # Empty
+            self.app.set_button_color( # Empty
                 push2_python.constants.BUTTON_UPPER_ROW_7, definitions.BLACK
             )
-            self.push.buttons.set_button_color( # Empty
+            self.app.set_button_color( # Empty
                 push2_python.constants.BUTTON_UPPER_ROW_8, definitions.BLACK
             )
 
@@ -420,7 +420,7 @@ class SettingsMode(definitions.PushItMode):
             ctx.line_to(x, curve_y)
             ctx.fill()
 
-            current_time = time.time()
+            current_time = time.monotonic()
             if current_time - self.app.melodic_mode.latest_channel_at_value[0] < 3 and not self.app.melodic_mode.use_poly_at:
                 # Lastest channel AT value received less than 3 seconds ago
                 draw_text_at(ctx, 3, part_h - 3, f'Latest cAT: {self.app.melodic_mode.latest_channel_at_value[1]}', font_size=20)
@@ -433,7 +433,7 @@ class SettingsMode(definitions.PushItMode):
 
 
     def on_encoder_rotated(self, encoder_name, increment):
-        self.encoders_state[encoder_name]['last_message_received'] = time.time()
+        self.encoders_state[encoder_name]['last_message_received'] = time.monotonic()
         # Lists are scrolled with the "slow" profile for precise one-item
         # movement; numeric value edits use the default "fast" profile. The
         # list encoders differ per settings page.
@@ -510,17 +510,15 @@ class SettingsMode(definitions.PushItMode):
 
     def on_button_pressed(self, button_name, shift = False):
         if button_name == push2_python.constants.BUTTON_SETUP:
-            self.setup_button_pressing_time = time.time()
+            self.setup_button_pressing_time = time.monotonic()
             # Toggle settings mode on/off without cycling pages
             if self.app.is_mode_active(self):
                 # If we're already in settings mode, deactivate it
-                self.app.active_modes = [
-                    mode for mode in self.app.active_modes if mode != self
-                ]
+                self.app.remove_active_mode(self)
                 self.deactivate()
             else:
                 # If we're not in settings mode, activate it
-                self.app.active_modes.append(self)
+                self.app.add_active_mode(self)
                 self.activate()
             self.app.buttons_need_update = True
             return True
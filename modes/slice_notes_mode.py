@@ -42,7 +42,7 @@ class SliceNotesMode(MelodicMode):
                 row_colors.append(cell_color)
             color_matrix.append(row_colors)
 
-        self.push.pads.set_pads_color(color_matrix)
+        self.app.set_pads_color(color_matrix)
 
     def on_button_pressed(self, button_name):
 
@@ -10,6 +10,7 @@ from utils import show_text
 class TrackSelectionMode(definitions.PushItMode):
 
     devices_info = {}
+    definition_names = {}  # Device name -> matched definition name, see get_device_definition_name
 
     track_button_names = [
         push2_python.constants.BUTTON_LOWER_ROW_1,
@@ -45,6 +46,8 @@ class TrackSelectionMode(definitions.PushItMode):
         for example, a list of midi CC parameter mappings).
         """
         print('Loading hardware device definitions...')
+        # Device names may match different definitions once these are reloaded
+        self.definition_names = {}
         try:
             for filename in os.listdir(definitions.INSTRUMENT_DEFINITION_FOLDER):
                 if filename.endswith('.json'):
@@ -66,18 +69,27 @@ class TrackSelectionMode(definitions.PushItMode):
         Match a full MIDI device name to its definition file name.
         For example, 'NTS-1 digital kit SOUND' matches 'NTS-1'.
         Returns the definition name if found, otherwise returns the original device_name.
+        Matches are memoized in definition_names as this is called on every pad event.
         """
         if device_name is None:
             return None
-        
+
+        definition_name = self.definition_names.get(device_name)
+        if definition_name is None:
+            definition_name = self._match_device_definition_name(device_name)
+            self.definition_names[device_name] = definition_name
+        return definition_name
+
+    def _match_device_definition_name(self, device_name):
         # Check for exact match first
         if device_name in self.devices_info:
             return device_name
         
         # Check if any definition name is contained in the device name
+        upper_device_name = device_name.upper()
         for def_name in self.devices_info.keys():
             # Case-insensitive match: check if definition name is in the device name
-            if def_name.upper() in device_name.upper():
+            if def_name.upper() in upper_device_name:
                 return def_name
         
         # No match found, return original name
@@ -200,14 +212,14 @@ class TrackSelectionMode(definitions.PushItMode):
                     color = color + '_darker1'
             else:
                 color = definitions.BLACK
-            self.push.buttons.set_button_color(name, color)
+            self.app.set_button_color(name, color)
 
         # Update ADD_TRACK button
         occupied = sum(1 for t in self.app.session.tracks if t is not None)
         if occupied < 8:
-            self.push.buttons.set_button_color(self.ADD_TRACK_BUTTON, definitions.WHITE)
+            self.app.set_button_color(self.ADD_TRACK_BUTTON, definitions.WHITE)
         else:
-            self.push.buttons.set_button_color(self.ADD_TRACK_BUTTON, definitions.OFF_BTN_COLOR)
+            self.app.set_button_color(self.ADD_TRACK_BUTTON, definitions.OFF_BTN_COLOR)
 
         # Update DEVICE button - show selected track color if any
         selected_track = self.get_selected_track()
@@ -215,11 +227,11 @@ class TrackSelectionMode(definitions.PushItMode):
             track_idx = self.app.session.tracks.index(selected_track)
             if track_idx >= 0:
                 color = self.get_track_color(track_idx)
-                self.push.buttons.set_button_color(self.DEVICE_BUTTON, color)
+                self.app.set_button_color(self.DEVICE_BUTTON, color)
             else:
-                self.push.buttons.set_button_color(self.DEVICE_BUTTON, definitions.OFF_BTN_COLOR)
+                self.app.set_button_color(self.DEVICE_BUTTON, definitions.OFF_BTN_COLOR)
         else:
-            self.push.buttons.set_button_color(self.DEVICE_BUTTON, definitions.OFF_BTN_COLOR)
+            self.app.set_button_color(self.DEVICE_BUTTON, definitions.OFF_BTN_COLOR)
 
     def activate(self):
         self.update_buttons()
@@ -232,7 +244,7 @@ class TrackSelectionMode(definitions.PushItMode):
 
     def deactivate(self):
         for button_name in self.track_button_names:
-            self.push.buttons.set_button_color(button_name, definitions.BLACK)
+            self.app.set_button_color(button_name, definitions.BLACK)
 
     def check_for_delayed_actions(self):
         track = self.get_selected_track()
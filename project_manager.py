@@ -6,6 +6,7 @@ import isobar as iso
 import numpy as np
 from numpyencoder import NumpyEncoder
 
+import definitions
 from track import Track
 from clip import Clip
 from modes.scale_mode import _canonical_key_name, get_isobar_scale, get_scale_pattern, KEY_TO_MIDI
@@ -141,7 +142,10 @@ class ProjectManager:
                         clip.clip_length_in_beats = clip_data["clip_length_in_beats"]
                         clip.step_divisions = clip_data["step_divisions"]
                         clip.beats_per_bar = clip_data["beats_per_bar"]
-                        clip.notes = np.array(clip_data["notes"], dtype=object)
+                        notes = np.array(clip_data["notes"], dtype=object)
+                        # Projects saved before notes became an int array use null for empty voices
+                        notes[np.equal(notes, None)] = definitions.NO_NOTE
+                        clip.notes = notes.astype(np.int16)
                         clip.durations = np.array(
                             clip_data["durations"], dtype=np.float32
                         )
@@ -152,6 +156,10 @@ class ProjectManager:
 
                     self.app.session.tracks[track_idx] = track
 
+            # Clips of the previous project are dropped from the playing set only once all tracks
+            # were replaced, a failed load keeps them playing
+            self.app.session.playing_clips.clear()
+
             self.current_project_file = filename
             print(f"Project loaded: {filepath}")
 
@@ -49,41 +49,9 @@ class Sequencer:
             print(f"[Sequencer] No output device for track '{clip.track.device_short_name}', skipping clip '{clip.name}'")
             return
 
-        # Convert polyphonic numpy arrays to lists for isobar
-        notes_list = []
-        durations_list = []
-        amplitudes_list = []
-
-        for step_idx in range(clip.steps):
-            step_notes = []
-            step_durations = []
-            step_amplitudes = []
-
-            # Collect all non-None notes at this step
-            for voice in range(clip.max_polyphony):
-                note = clip.notes[step_idx, voice]
-                if note is not None:
-                    step_notes.append(int(note))
-                    step_durations.append(float(clip.durations[step_idx, voice]))
-                    step_amplitudes.append(int(clip.amplitudes[step_idx, voice]))
-
-            # Format for isobar: tuples for chords, single values for single notes
-            # Duration is always a single value (all notes in a chord have same duration)
-            if step_notes:
-                if len(step_notes) > 1:
-                    notes_list.append(tuple(step_notes))
-                    durations_list.append(
-                        step_durations[0]
-                    )  # Use first duration for all notes
-                    amplitudes_list.append(tuple(step_amplitudes))
-                else:
-                    notes_list.append(step_notes[0])
-                    durations_list.append(step_durations[0])
-                    amplitudes_list.append(step_amplitudes[0])
-            else:
-                notes_list.append(None)
-                durations_list.append(0.25)
-                amplitudes_list.append(0)
+        # Polyphonic numpy arrays as lists for isobar (cached by the clip until it is edited)
+        sequence_data = clip.get_sequence_data_for_timeline()
+        durations_list = sequence_data["duration"]
 
         # Calculate the actual start time for this clip
         current_time = self.timeline.current_time
@@ -104,9 +72,9 @@ class Sequencer:
 
         self.timeline.schedule(
             {
-                "note": iso.PSequence(notes_list),
+                "note": iso.PSequence(sequence_data["note"]),
                 "duration": iso.PSequence(durations_list),
-                "amplitude": iso.PSequence(amplitudes_list),
+                "amplitude": iso.PSequence(sequence_data["amplitude"]),
             },
             name=clip.name,
             quantize=0.0,
@@ -118,6 +86,9 @@ class Sequencer:
 
     def check_queued_clips(self):
         """Check if any clips should switch due to queuing"""
+        # Clips only switch at a registered loop point, nothing to do without any
+        if not self.clip_loop_positions:
+            return
         current_time = self.timeline.current_time
 
         for track in self.app.session.tracks:
@@ -1,4 +1,5 @@
-from typing import Dict, List, Optional
+import time
+from typing import Dict, List, Optional, Set, Tuple
 
 import isobar as iso
 
@@ -9,6 +10,22 @@ from clip import Clip
 from track import Track
 
 DEVICES_TO_IGNORE = ["Ableton Push", "RtMidi", "Through", "pisound-ctl"]
+# Push ports are by far the most common ignored names and (on Linux and macOS)
+# start with this prefix, so check it first before the substring scan
+DEVICE_PREFIXES_TO_IGNORE = ("Ableton Push",)
+# Enumerating MIDI ports is slow (it queries the OS MIDI backend), so the result
+# is reused by all callers for this many seconds
+MIDI_PORT_NAMES_CACHE_TIME = 1.0
+
+
+def filter_device_names(names):
+    """Return the MIDI port names in names that are not system-related devices (see DEVICES_TO_IGNORE)"""
+    return [
+        name
+        for name in names
+        if not name.startswith(DEVICE_PREFIXES_TO_IGNORE)
+        and not any(device in name for device in DEVICES_TO_IGNORE)
+    ]
 
 
 class Session(BaseClass):
@@ -31,6 +48,8 @@ class Session(BaseClass):
 
     def __init__(self, app):
         super().__init__(parent=app)
+        self._midi_port_names: Tuple[List[str], List[str]] = None
+        self._midi_port_names_time = 0.0
         self.global_timeline = app.global_timeline
         self.global_timeline.max_tracks = definitions.GLOBAL_TIMELINE_MAX_TRACKS
         self.key = iso.Key(self.root, self.scale)
@@ -38,6 +57,8 @@ class Session(BaseClass):
         # MIDI management
         self.input_device_names = self._get_safe_input_device_names()
         self.output_device_names = self._get_safe_output_device_names()
+        # Port names found by the last scan_midi_devices (only used by the thread running the scans)
+        self._scanned_midi_port_names = self._midi_port_names
         self.input_devices: Dict[str, iso.MidiInputDevice] = {}
         self.output_devices: Dict[str, iso.MidiOutputDevice] = {}
         self._active_input_device_name: str = None
@@ -45,6 +66,7 @@ class Session(BaseClass):
         self.track_clips: Dict[str, object] = {}  # track_uuid -> clip object
         self.pending_actions: List[Dict] = []  # List of {beat, action, clip}
         self.pending_scene_transition = None  # {time, clips_to_stop, clips_to_start}
+        self.playing_clips: Set[object] = set()  # clips add/remove themselves on play/stop
 
         # Initialize with 8 empty slots (None) to allow manual track creation
         self.tracks = [None] * definitions.MAX_TRACKS
@@ -277,15 +299,17 @@ class Session(BaseClass):
 
     def _register_midi_input_handlers(self, device, device_name):
         """Register note handlers on an input device that filter by active device name."""
+        # These run for every incoming note of every open input, so reject notes from
+        # inactive devices with a single comparison (device_name is never None)
         def make_filtered_note_on(app):
             def on_note_on(midi_note):
-                if self._active_input_device_name is not None and self._active_input_device_name == device_name:
+                if self._active_input_device_name == device_name:
                     app._on_midi_in_note_on(midi_note)
             return on_note_on
 
         def make_filtered_note_off(app):
             def on_note_off(midi_note):
-                if self._active_input_device_name is not None and self._active_input_device_name == device_name:
+                if self._active_input_device_name == device_name:
                     app._on_midi_in_note_off(midi_note)
             return on_note_off
 
@@ -296,8 +320,8 @@ class Session(BaseClass):
 
     def get_output_device(self, device_name: str) -> Optional[iso.MidiOutputDevice]:
         """Get output device by name"""
-        if device_name not in self.output_device_names:
-            self.update_midi_devices()
+        # Called for every note/CC sent, so this is only a dict lookup. Newly connected
+        # devices are opened by the periodic background scan (see scan_midi_devices)
         return self.output_devices.get(device_name)
 
     def update_midi_devices(self):
@@ -305,41 +329,89 @@ class Session(BaseClass):
         Check for newly connected MIDI devices and
         merge them into the existing device lists
         """
+        scan_result = self.scan_midi_devices()
+        if scan_result is not None:
+            self.apply_midi_devices(scan_result)
+
+    def scan_midi_devices(self):
+        """
+        Enumerate the MIDI ports and open the ones that are not open yet. This is slow, so the app
+        runs it in a background thread (see PushItApp.check_for_new_midi_devices). It does not
+        modify the session, the result is merged on the main thread by apply_midi_devices.
+
+        Returns (input names, output names, opened input devices, opened output devices), or None
+        if the available ports did not change since the last scan and all of them are open.
+        """
         try:
-            self.input_device_names = list(
-                set(self.input_device_names + self._get_safe_input_device_names())
+            port_names = (
+                filter_device_names(iso.get_midi_input_names()),
+                filter_device_names(iso.get_midi_output_names()),
             )
-            self.output_device_names = list(
-                set(self.output_device_names + self._get_safe_output_device_names())
-            )
-            # Create MidiInputDevice instances for any newly discovered input devices
-            for name in self.input_device_names:
-                if name not in self.input_devices:
-                    try:
-                        device = iso.MidiInputDevice(name)
-                        self.input_devices[name] = device
-                        self._register_midi_input_handlers(device, name)
-                        print(f"Added isobar MIDI input: {name}")
-                    except Exception as e:
-                        print(f"Failed to add isobar input {name}: {e}")
         except Exception as e:
             print(f"Error checking for new MIDI devices: {e}")
+            return None
+        input_names, output_names = port_names
+        missing_inputs = [name for name in input_names if name not in self.input_devices]
+        missing_outputs = [name for name in output_names if name not in self.output_devices]
+        if port_names == self._scanned_midi_port_names and not missing_inputs and not missing_outputs:
+            # Nothing was plugged in since the last scan and no port is left to retry
+            return None
+        self._scanned_midi_port_names = port_names
+
+        opened_inputs: Dict[str, iso.MidiInputDevice] = {}
+        for name in missing_inputs:
+            try:
+                opened_inputs[name] = iso.MidiInputDevice(name)
+                print(f"Added isobar MIDI input: {name}")
+            except Exception as e:
+                print(f"Failed to add isobar input {name}: {e}")
+
+        opened_outputs: Dict[str, iso.MidiOutputDevice] = {}
+        for name in missing_outputs:
+            try:
+                opened_outputs[name] = iso.MidiOutputDevice(name)
+                print(f"Initialized MIDI output: {name}")
+            except Exception as e:
+                print(f"Failed to initialize output {name}: {e}")
+
+        return list(input_names), list(output_names), opened_inputs, opened_outputs
+
+    def apply_midi_devices(self, scan_result):
+        """Merge the result of scan_midi_devices into the device lists and dicts. Must run on
+        the main thread, which is the only one modifying them"""
+        input_names, output_names, opened_inputs, opened_outputs = scan_result
+        # Swap in new lists rather than modifying the ones UI code may be holding
+        self.input_device_names = list(set(self.input_device_names + input_names))
+        self.output_device_names = list(set(self.output_device_names + output_names))
+        for name, device in opened_inputs.items():
+            if name not in self.input_devices:
+                self.input_devices[name] = device
+                self._register_midi_input_handlers(device, name)
+        for name, device in opened_outputs.items():
+            self.output_devices.setdefault(name, device)
+        # The fresh enumeration is also good for _get_midi_port_names callers
+        self._midi_port_names = (input_names, output_names)
+        self._midi_port_names_time = time.monotonic()
+
+    def _get_midi_port_names(self):
+        """Get (input names, output names) of the available MIDI ports excluding system-related devices.
+        The result is enumerated and filtered once and reused for MIDI_PORT_NAMES_CACHE_TIME"""
+        now = time.monotonic()
+        if self._midi_port_names is None or now - self._midi_port_names_time > MIDI_PORT_NAMES_CACHE_TIME:
+            self._midi_port_names = (
+                filter_device_names(iso.get_midi_input_names()),
+                filter_device_names(iso.get_midi_output_names()),
+            )
+            self._midi_port_names_time = now
+        return self._midi_port_names
 
     def _get_safe_input_device_names(self):
         """Get input device names excluding system-related devices"""
-        return [
-            name
-            for name in iso.get_midi_input_names()
-            if not any(device in name for device in DEVICES_TO_IGNORE)
-        ]
+        return list(self._get_midi_port_names()[0])
 
     def _get_safe_output_device_names(self):
-        """Get input device names excluding system-related devices"""
-        return [
-            name
-            for name in iso.get_midi_output_names()
-            if not any(device in name for device in DEVICES_TO_IGNORE)
-        ]
+        """Get output device names excluding system-related devices"""
+        return list(self._get_midi_port_names()[1])
 
     ############################################################################
     # Timeline Management
@@ -374,10 +446,12 @@ class Session(BaseClass):
             pass
         else:
             if velocity > 0:
-                print(f"Sending note ON: {note} vel={velocity} to {device_name}")
+                if definitions.DEBUG_MIDI_OUT:
+                    print(f"Sending note ON: {note} vel={velocity} to {device_name}")
                 output_device.note_on(note, velocity, channel)
             else:
-                print(f"Sending note OFF: {note} to {device_name}")
+                if definitions.DEBUG_MIDI_OUT:
+                    print(f"Sending note OFF: {note} to {device_name}")
                 output_device.note_off(note, channel)
 
     def send_cc(self, device_name: str, cc_number: int, value: int, channel: int = 0):
@@ -388,5 +462,6 @@ class Session(BaseClass):
             print(f"No output device found: {device_name}")
             pass
         else:
-            print(f"Sending CC: {cc_number} val={value} to {device_name}")
+            if definitions.DEBUG_MIDI_OUT:
+                print(f"Sending CC: {cc_number} val={value} to {device_name}")
             output_device.control(control=cc_number, value=value, channel=channel)
@@ -120,7 +120,8 @@ def mock_app(mock_push2_environment, mock_isobar_midi):
     app = MagicMock()
     app.push = mock_push2_environment['push2']
     app.settings = {}
-    app.active_modes = []
+    app.active_modes = {}
+    app._active_modes_reversed = ()
     app.buttons_need_update = False
     app.pads_need_update = False
 
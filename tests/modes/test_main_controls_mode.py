@@ -68,11 +68,14 @@ class TestMainControlsMode:
         mode = MainControlsMode(mock_app)
         mock_app.use_push2_display = True
         mock_app.buttons_need_update = False
+        mock_app.clear_display = MagicMock()
         mock_app.push.display.send_to_display = MagicMock()
         result = mode.on_button_pressed(TOGGLE_DISPLAY_BUTTON)
         assert result is True
         assert mock_app.use_push2_display is False
-        mock_app.push.display.send_to_display.assert_called_once()
+        # The black frame goes through the app's display sender thread
+        mock_app.clear_display.assert_called_once()
+        mock_app.push.display.send_to_display.assert_not_called()
         assert mock_app.buttons_need_update is True
 
     def test_on_button_pressed_clip_triggering_activate(self, mock_app):
@@ -160,7 +163,7 @@ class TestMainControlsMode:
 
     def test_on_button_released_preset_selection_long_press(self, mock_app):
         mode = MainControlsMode(mock_app)
-        mode.preset_selection_button_pressing_time = time.time() - 1.0
+        mode.preset_selection_button_pressing_time = time.monotonic() - 1.0
         mock_app.unset_preset_selection_mode = MagicMock()
         mock_app.buttons_need_update = False
         result = mode.on_button_released(PRESET_SELECTION_MODE_BUTTON)
@@ -187,4 +190,4 @@ class TestMainControlsMode:
         mock_app.global_timeline.is_running = False
         mock_app.push.buttons = MagicMock()
         mode.update_buttons()
-        assert mock_app.push.buttons.set_button_color.called
+        assert mock_app.set_button_color.called
@@ -53,6 +53,7 @@ class TestRhythmicMode:
         mode = RhythmicMode(mock_app)
         # Replace pads with a mock
         mode.push.pads = MagicMock()
+        mode.app.set_pads_color = MagicMock()
         
         # Mock is_midi_note_being_played to return False
         mode.is_midi_note_being_played = MagicMock(return_value=False)
@@ -61,8 +62,8 @@ class TestRhythmicMode:
         mode.update_pads()
         
         # Verify set_pads_color was called with an 8x8 matrix
-        mode.push.pads.set_pads_color.assert_called_once()
-        color_matrix = mode.push.pads.set_pads_color.call_args[0][0]
+        mode.app.set_pads_color.assert_called_once()
+        color_matrix = mode.app.set_pads_color.call_args[0][0]
         assert len(color_matrix) == 8
         for row in color_matrix:
             assert len(row) == 8
@@ -71,12 +72,13 @@ class TestRhythmicMode:
         """Test that update_pads applies correct color pattern."""
         mode = RhythmicMode(mock_app)
         mode.push.pads = MagicMock()
+        mode.app.set_pads_color = MagicMock()
         
         # Mock is_midi_note_being_played to return False
         mode.is_midi_note_being_played = MagicMock(return_value=False)
         
         mode.update_pads()
-        color_matrix = mode.push.pads.set_pads_color.call_args[0][0]
+        color_matrix = mode.app.set_pads_color.call_args[0][0]
         
         # Check pattern:
         # i >= 4 and j < 4: track color
@@ -97,6 +99,7 @@ class TestRhythmicMode:
         """Test that playing notes show NOTE_ON_COLOR."""
         mode = RhythmicMode(mock_app)
         mode.push.pads = MagicMock()
+        mode.app.set_pads_color = MagicMock()
         
         # Mock is_midi_note_being_played to return True for specific note
         def mock_is_playing(note):
@@ -105,7 +108,7 @@ class TestRhythmicMode:
         mode.is_midi_note_being_played = mock_is_playing
         
         mode.update_pads()
-        color_matrix = mode.push.pads.set_pads_color.call_args[0][0]
+        color_matrix = mode.app.set_pads_color.call_args[0][0]
         
         # Find which pad corresponds to MIDI note 60
         # From matrix check row 1 col 0 = 60
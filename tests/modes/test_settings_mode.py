@@ -37,12 +37,12 @@ class TestSettingsMode:
 
     def test_on_button_pressed_setup(self, mock_app):
         mode = SettingsMode(mock_app)
-        mock_app.active_modes = []
+        mock_app.active_modes = {}
         mock_app.is_mode_active = MagicMock(return_value=False)
         mock_app.buttons_need_update = False
         result = mode.on_button_pressed(push2_python.constants.BUTTON_SETUP)
         assert result is True
-        assert mode in mock_app.active_modes
+        mock_app.add_active_mode.assert_called_once_with(mode)
 
     def test_on_button_pressed_other(self, mock_app):
         mode = SettingsMode(mock_app)
@@ -244,7 +244,7 @@ class TestSettingsMode:
     def test_on_button_released_setup_long_press(self, mock_app):
         mode = SettingsMode(mock_app)
         mode.current_page = Pages.PERFORMANCE
-        mode.setup_button_pressing_time = time.time() - 1.0  # > BUTTON_QUICK_PRESS_TIME
+        mode.setup_button_pressing_time = time.monotonic() - 1.0  # > BUTTON_QUICK_PRESS_TIME
         # SettingsMode has no on_button_released method, so this returns None
         result = mode.on_button_released(push2_python.constants.BUTTON_SETUP)
         assert result is None
@@ -252,7 +252,7 @@ class TestSettingsMode:
     def test_deactivate_clears_state(self, mock_app):
         mode = SettingsMode(mock_app)
         mode.current_page = Pages.SESSION
-        mode.setup_button_pressing_time = time.time()
+        mode.setup_button_pressing_time = time.monotonic()
         mode.original_device_assignments = {0: {}}
         mode.modified_tracks = {0}
         mode.deactivate()
@@ -58,6 +58,7 @@ class TestSliceNotesMode:
         mode = SliceNotesMode(mock_app)
         # Replace pads with a mock
         mode.push.pads = MagicMock()
+        mode.app.set_pads_color = MagicMock()
         
         # Mock is_midi_note_being_played to return False
         mode.is_midi_note_being_played = MagicMock(return_value=False)
@@ -68,8 +69,8 @@ class TestSliceNotesMode:
         mode.update_pads()
         
         # Verify set_pads_color was called
-        mode.push.pads.set_pads_color.assert_called_once()
-        color_matrix = mode.push.pads.set_pads_color.call_args[0][0]
+        mode.app.set_pads_color.assert_called_once()
+        color_matrix = mode.app.set_pads_color.call_args[0][0]
         assert len(color_matrix) == 8
         for row in color_matrix:
             assert len(row) == 8
@@ -78,12 +79,13 @@ class TestSliceNotesMode:
         """Test color alternates based on note group (even/odd 16-note groups)."""
         mode = SliceNotesMode(mock_app)
         mode.push.pads = MagicMock()
+        mode.app.set_pads_color = MagicMock()
         mode.is_midi_note_being_played = MagicMock(return_value=False)
         mode.app.track_selection_mode.get_current_track_color.return_value = 'TRACK_COLOR'
         
         mode.start_note = 0
         mode.update_pads()
-        color_matrix = mode.push.pads.set_pads_color.call_args[0][0]
+        color_matrix = mode.app.set_pads_color.call_args[0][0]
         
         # midi_16_note_groups_idx = corresponding_midi_note // 16
         # even groups -> track_color, odd groups -> WHITE
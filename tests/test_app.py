@@ -40,6 +40,9 @@ class TestUnsetModeForXorGroup:
         app.unset_mode_for_xor_group = PushItApp.unset_mode_for_xor_group.__get__(app, PushItApp)
         app.is_mode_active      = PushItApp.is_mode_active.__get__(app, PushItApp)
         app.set_mode_for_xor_group      = PushItApp.set_mode_for_xor_group.__get__(app, PushItApp)
+        app.add_active_mode = PushItApp.add_active_mode.__get__(app, PushItApp)
+        app.remove_active_mode = PushItApp.remove_active_mode.__get__(app, PushItApp)
+        app._rebuild_active_mode_caches = PushItApp._rebuild_active_mode_caches.__get__(app, PushItApp)
         app.get_default_pad_mode_for_xor_group = PushItApp.get_default_pad_mode_for_xor_group.__get__(app, PushItApp)
 
         # Set up mode attributes
@@ -50,7 +53,8 @@ class TestUnsetModeForXorGroup:
         app.midi_cc_mode = mock_midi_cc_mode
 
         # Set up state
-        app.active_modes = [mock_add_track_mode]
+        app.active_modes = {mock_add_track_mode: None}
+        app._active_by_xor = {"pads": [mock_add_track_mode]}
         app.previously_active_mode_for_xor_group = {}
 
         yield app
@@ -204,7 +208,7 @@ class TestComputeAcceleratedIncrement:
         # First moderate event
         app_module.compute_accelerated_increment("enc1", 1, profile="fast")
         # Second event immediately after (short interval) should accelerate
-        result = app_module.compute_accelerated_increment("enc1", 1, now=time.time(), profile="fast")
+        result = app_module.compute_accelerated_increment("enc1", 1, now=time.monotonic(), profile="fast")
         assert abs(result) >= 1
 
     def test_slow_profile_is_less_sensitive_than_fast(self, mock_push2_environment):
@@ -216,10 +220,10 @@ class TestComputeAcceleratedIncrement:
         assert slow_max < fast_max
         # Same rapid large flick -> slow profile capped lower than fast profile
         app_module.compute_accelerated_increment("enc2", 63, profile="fast")
-        fast_result = app_module.compute_accelerated_increment("enc2", 63, now=time.time(), profile="fast")
+        fast_result = app_module.compute_accelerated_increment("enc2", 63, now=time.monotonic(), profile="fast")
         app_module.encoder_last_event_time["enc2"] = 0
         app_module.compute_accelerated_increment("enc2", 63, profile="slow")
-        slow_result = app_module.compute_accelerated_increment("enc2", 63, now=time.time(), profile="slow")
+        slow_result = app_module.compute_accelerated_increment("enc2", 63, now=time.monotonic(), profile="slow")
         assert abs(slow_result) < abs(fast_result)
 
 
@@ -264,6 +268,8 @@ class TestOnEncoderRotatedAcceleration:
         mode = MagicMock()
         mode.on_encoder_rotated = MagicMock(return_value=True)
         mock_app.active_modes = [mode]
+        mock_app._active_modes_reversed = (mode,)
+        mock_app._mode_hooks = {"on_encoder_rotated": (mode.on_encoder_rotated,)}
 
         app_module.app = mock_app
         app_module.on_encoder_rotated(None, "some_encoder", 1)
@@ -281,9 +287,251 @@ class TestOnEncoderRotatedAcceleration:
         mode = MagicMock()
         mode.on_encoder_rotated = MagicMock(return_value=True)
         mock_app.active_modes = [mode]
+        mock_app._active_modes_reversed = (mode,)
+        mock_app._mode_hooks = {"on_encoder_rotated": (mode.on_encoder_rotated,)}
 
         app_module.app = mock_app
         app_module.on_encoder_rotated(None, "some_encoder", 20)
         # app.py no longer pre-accelerates; the mode receives the raw increment
         called_increment = mode.on_encoder_rotated.call_args[0][1]
         assert called_increment == 20
+
+
+class TestSetPadsColor:
+
+    def test_only_changed_pads_are_sent(self, mock_push2_environment):
+        from app import PushItApp
+
+        app = MagicMock(spec=PushItApp)
+        app.push = MagicMock()
+        app._pads_color_cache = None
+        set_pads_color = PushItApp.set_pads_color.__get__(app, PushItApp)
+
+        black = [["black"] * 8 for _ in range(8)]
+        set_pads_color(black)
+        app.push.pads.set_pads_color.assert_called_once()
+
+        set_pads_color([row[:] for row in black])
+        app.push.pads.set_pad_color.assert_not_called()
+
+        changed = [row[:] for row in black]
+        changed[2][3] = "red"
+        set_pads_color(changed)
+        app.push.pads.set_pad_color.assert_called_once_with((2, 3), color="red")
+        assert app.push.pads.set_pads_color.call_count == 1
+
+
+class TestSetButtonColor:
+
+    @pytest.fixture
+    def app(self, mock_push2_environment):
+        from app import PushItApp
+
+        app = MagicMock(spec=PushItApp)
+        app.push = MagicMock()
+        app._button_color_cache = {}
+        app.set_button_color = PushItApp.set_button_color.__get__(app, PushItApp)
+        return app
+
+    def test_unchanged_color_is_not_resent(self, app):
+        app.set_button_color("Play", "green")
+        app.set_button_color("Play", "green")
+        app.push.buttons.set_button_color.assert_called_once_with("Play", "green")
+
+    def test_force_restarts_animation(self, app):
+        app.set_button_color("Settings", "white", animation="pulse", force=True)
+        app.set_button_color("Settings", "white", animation="pulse", force=True)
+        assert app.push.buttons.set_button_color.call_count == 2
+        app.push.buttons.set_button_color.assert_called_with("Settings", "white", animation="pulse")
+
+        # The forced state is still cached for non-forced callers
+        app.set_button_color("Settings", "white", animation="pulse")
+        assert app.push.buttons.set_button_color.call_count == 2
+
+        app.set_button_color("Settings", "white")
+        assert app.push.buttons.set_button_color.call_count == 3
+
+
+class TestMidiDeviceScans:
+
+    @pytest.fixture
+    def app(self, mock_push2_environment):
+        import queue
+        import threading
+        from app import PushItApp
+
+        app = MagicMock(spec=PushItApp)
+        app.session = MagicMock()
+        app._midi_scan_jobs = queue.Queue()
+        app._midi_scan_results = queue.Queue()
+        app._midi_scan_pending = False
+        app.check_for_new_midi_devices = PushItApp.check_for_new_midi_devices.__get__(app, PushItApp)
+        app._midi_scan_worker = PushItApp._midi_scan_worker.__get__(app, PushItApp)
+        app.apply_midi_device_scans = PushItApp.apply_midi_device_scans.__get__(app, PushItApp)
+        # PushItApp.__init__ starts the worker
+        threading.Thread(target=app._midi_scan_worker, daemon=True).start()
+        return app
+
+    def test_scan_result_is_merged_on_main_thread(self, app):
+        scan_result = (['Keys'], ['Synth'], {}, {})
+        app.session.scan_midi_devices.return_value = scan_result
+
+        app.check_for_new_midi_devices()
+        # A new scan is not queued while the previous one is pending
+        app.check_for_new_midi_devices()
+        # Wait for the worker, then hand the result back as the main loop would
+        result = app._midi_scan_results.get(timeout=5)
+        app._midi_scan_results.put(result)
+
+        app.session.apply_midi_devices.assert_not_called()
+        app.apply_midi_device_scans()
+        app.session.apply_midi_devices.assert_called_once_with(scan_result)
+        app.session.scan_midi_devices.assert_called_once()
+        assert not app._midi_scan_pending
+
+    def test_unchanged_ports_are_not_merged(self, app):
+        app._midi_scan_pending = True
+        app._midi_scan_results.put(None)
+
+        app.apply_midi_device_scans()
+        app.session.apply_midi_devices.assert_not_called()
+        assert not app._midi_scan_pending
+
+
+class TestDisplaySender:
+
+    @pytest.fixture
+    def app(self, mock_push2_environment):
+        import queue
+        import numpy
+        from app import PushItApp
+
+        app = MagicMock(spec=PushItApp)
+        app.push = mock_push2_environment['push2']
+        app.use_push2_display = True
+        app.notification_text = None
+        app.display_needs_update = False
+        app._display_surfaces = [MagicMock() for _ in range(3)]
+        app._display_ctxs = [MagicMock(idx=i) for i in range(3)]
+        app._display_frames = [numpy.zeros((4, 2), dtype=numpy.uint16) for _ in range(3)]
+        app._display_busy = bytearray(3)
+        app._display_last_idx = None
+        app._display_last_send_time = 0.0
+        app._display_queue = queue.Queue(maxsize=1)
+        # The single active "mode" draws the current pixel value into the frame being rendered
+        app.pixel_value = 1
+        app._mode_hooks = {
+            "update_display": (lambda ctx, w, h: app._display_frames[ctx.idx].fill(app.pixel_value),)
+        }
+        for name in ("update_push2_display", "queue_display_frame", "_get_free_display_buffer_idx",
+                     "clear_display", "_display_sender"):
+            setattr(app, name, getattr(PushItApp, name).__get__(app, PushItApp))
+        return app
+
+    def _take_sent_frame(self, app):
+        """Do what the sender thread does with the queued frame, returns its buffer index"""
+        idx = app._display_queue.get_nowait()
+        app._display_busy[idx] = 0
+        return idx
+
+    def test_unchanged_frame_is_not_resent_within_keepalive(self, app):
+        app.update_push2_display()
+        self._take_sent_frame(app)
+
+        app.update_push2_display()
+        assert app._display_queue.empty()
+
+    def test_unchanged_frame_is_resent_after_keepalive(self, app):
+        import definitions
+
+        app.update_push2_display()
+        self._take_sent_frame(app)
+        app._display_last_send_time -= definitions.DISPLAY_KEEPALIVE_TIME + 1
+
+        app.update_push2_display()
+        assert app._display_queue.qsize() == 1
+
+    def test_changed_frame_is_sent_once(self, app):
+        app.update_push2_display()
+        first_idx = self._take_sent_frame(app)
+
+        app.pixel_value = 2
+        app.update_push2_display()
+        idx = self._take_sent_frame(app)
+        assert idx != first_idx
+        assert app._display_frames[idx][0, 0] == 2
+        assert app._display_queue.empty()
+
+        app.update_push2_display()
+        assert app._display_queue.empty()
+
+    def test_full_queue_drops_stale_frame(self, app):
+        app.update_push2_display()
+        stale_idx = app._display_last_idx
+
+        # The sender has not picked up the previous frame, the new one replaces it without blocking
+        app.pixel_value = 2
+        app.update_push2_display()
+        assert app._display_queue.qsize() == 1
+        assert app._display_busy[stale_idx] == 0
+        idx = self._take_sent_frame(app)
+        assert idx != stale_idx
+        assert app._display_frames[idx][0, 0] == 2
+
+    def test_clear_display_goes_through_sender(self, app):
+        app.update_push2_display()
+        self._take_sent_frame(app)
+
+        app.clear_display()
+        idx = self._take_sent_frame(app)
+        assert not app._display_frames[idx].any()
+        app.push.display.send_to_display.assert_not_called()
+
+    def test_sender_thread_sends_queued_frames(self, app):
+        import threading
+        import time
+
+        threading.Thread(target=app._display_sender, daemon=True).start()
+        app.update_push2_display()
+        idx = app._display_last_idx
+
+        deadline = time.monotonic() + 5
+        while app._display_busy[idx] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        app.push.display.display_frame.assert_called_once()
+        assert app.push.display.display_frame.call_args[0][0] is app._display_frames[idx]
+        assert app._display_busy[idx] == 0
+
+
+class TestSaveSettings:
+
+    def test_settings_with_int_keys_and_numpy_values_are_written(self, mock_push2_environment, tmp_path):
+        import json
+        import queue
+        import threading
+        import numpy
+        from app import PushItApp
+
+        app = MagicMock(spec=PushItApp)
+        app.settings = {3: "int key", "root_note": numpy.int64(60)}
+        app.use_push2_display = True
+        app.target_frame_rate = 60
+        app.pm = MagicMock()
+        app.pm.current_project_file = None
+        app.midi_in_device_name = None
+        app.get_all_modes = MagicMock(return_value=[])
+        app.settings_dir = str(tmp_path)
+        app.settings_file = str(tmp_path / "settings.json")
+        app._settings_write_queue = queue.Queue()
+        save = PushItApp.save_current_settings_to_file.__get__(app, PushItApp)
+        writer = PushItApp._settings_writer.__get__(app, PushItApp)
+
+        save()
+        threading.Thread(target=writer, daemon=True).start()
+        app._settings_write_queue.join()
+
+        with open(app.settings_file) as f:
+            saved = json.load(f)
+        assert saved["3"] == "int key"
+        assert saved["root_note"] == 60
+        assert saved["target_frame_rate"] == 60
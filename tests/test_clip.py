@@ -2,6 +2,8 @@
 
 import pytest
 
+import definitions
+
 # Check if clip.py exists
 try:
     from clip import Clip
@@ -31,6 +33,15 @@ class TestClip:
         clip.track = track
         assert clip.playing is False
 
+    def test_play_stop_tracks_playing_clips(self, track, session):
+        """play()/stop() keep the session's playing_clips set up to date."""
+        clip = Clip(parent=track)
+        clip.app.session = session
+        clip.play()
+        assert clip in session.playing_clips
+        clip.stop()
+        assert clip not in session.playing_clips
+
     def test_clip_is_empty(self, track):
         """Test is_empty method."""
         clip = Clip()
@@ -66,3 +77,51 @@ class TestClip:
         rendered = clip.get_notes_for_rendering()
         assert len(rendered) == 1
         assert rendered[0]["duration_steps"] == 2
+
+    def test_clear_empties_clip_in_place(self, track):
+        clip = Clip(parent=track)
+        clip.add_note_at_step(2, 64, 0.25, 90)
+        notes = clip.notes
+        assert not clip.is_empty()
+        assert clip.get_unique_notes() == [64]
+        clip.clear()
+        assert clip.notes is notes
+        assert clip.is_empty()
+        assert clip.get_note_range() == (None, None)
+
+    def test_status_is_cached_until_state_changes(self, track):
+        clip = Clip(parent=track)
+        status = clip.get_status()
+        assert clip.get_status() is status
+        clip.will_play_at = 4.0
+        assert clip.get_status() is not status
+        assert clip.get_status().play_status == definitions.ClipStates.CLIP_STATUS_CUED_TO_PLAY
+        clip.add_note_at_step(0, 60, 0.25, 100)
+        assert clip.get_status().empty_status == definitions.ClipStates.CLIP_STATUS_IS_NOT_EMPTY
+
+    def test_non_status_attributes_keep_cached_status(self, track):
+        clip = Clip(parent=track)
+        status = clip.get_status()
+        data = clip.get_sequence_data_for_timeline()
+        clip.playhead_position_in_beats = 1.5
+        clip.window_step_offset = 8
+        assert clip.get_status() is status
+        assert clip.get_sequence_data_for_timeline() is data
+        clip.clip_length_in_beats = 8.0
+        assert clip.get_status().clip_length == 8.0
+        assert clip.get_sequence_data_for_timeline() is not data
+
+    def test_get_sequence_data_for_timeline(self, track):
+        clip = Clip(parent=track)
+        clip.steps = 2
+        clip.add_note_at_step(0, 60, 0.5, 100)
+        clip.add_note_at_step(0, 64, 0.25, 90)
+        data = clip.get_sequence_data_for_timeline()
+        assert data == {
+            "note": [(60, 64), None],
+            "duration": [0.5, 0.25],
+            "amplitude": [(100, 90), 0],
+        }
+        assert clip.get_sequence_data_for_timeline() is data
+        clip.remove_note_at_step(0, 64)
+        assert clip.get_sequence_data_for_timeline()["note"] == [60, None]
@@ -284,3 +284,19 @@ class TestProjectManager:
         # Likely fails due to missing keys, returns False
         # But we just want to cover the code path
         assert result is False or result is True
+
+    def test_load_project_failure_keeps_playing_clips(self, mock_app, tmp_path):
+        """Test a malformed project does not drop the clips that are still playing."""
+        projects_dir = tmp_path / "projects"
+        projects_dir.mkdir()
+        with open(projects_dir / "malformed.json", 'w') as f:
+            json.dump({"bpm": 120}, f)
+
+        playing_clip = MagicMock(playing=True)
+        mock_app.session.playing_clips = {playing_clip}
+
+        pm = ProjectManager(mock_app)
+        pm.projects_dir = str(projects_dir)
+
+        assert pm.load_project("malformed") is False
+        assert mock_app.session.playing_clips == {playing_clip}
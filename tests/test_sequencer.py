@@ -67,6 +67,11 @@ class TestSequencer:
         clip.amplitudes = np.array([[100, 90]], dtype=int)
         clip.steps = 1
         clip.max_polyphony = 2
+        clip.get_sequence_data_for_timeline.return_value = {
+            "note": [(60, 64)],
+            "duration": [0.5],
+            "amplitude": [(100, 90)],
+        }
         clip.clip_length_in_beats = 4.0
         clip.name = "TestClip"
         clip.track = MagicMock()
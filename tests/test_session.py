@@ -1,6 +1,6 @@
 """Tests for session.py module."""
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import isobar as iso
 from session import Session
@@ -249,6 +249,88 @@ class TestSession:
         assert hasattr(session, '_get_safe_input_device_names')
         assert hasattr(session, '_get_safe_output_device_names')
 
+    def test_midi_port_names_are_cached(self, mock_app):
+        """Test MIDI ports are enumerated once for calls within the cache time."""
+        mock_app.global_timeline = iso.Timeline()
+        session = Session(mock_app)
+        session._midi_port_names = None  # drop the enumeration done by __init__
+
+        with patch('isobar.get_midi_input_names', return_value=['Synth', 'Ableton Push 2 Live Port']) as get_inputs:
+            assert session._get_safe_input_device_names() == ['Synth']
+            assert session._get_safe_input_device_names() == ['Synth']
+            assert session._get_safe_output_device_names() == []
+            assert get_inputs.call_count == 1
+
+    def test_update_midi_devices_skips_unchanged_ports(self, mock_app):
+        """Test device lists are only rebuilt when the available ports change."""
+        mock_app.global_timeline = iso.Timeline()
+        session = Session(mock_app)
+        session.input_device_names = ['Keys']
+
+        with patch('isobar.get_midi_input_names', return_value=['Keys']), \
+                patch('isobar.get_midi_output_names', return_value=[]), \
+                patch('isobar.MidiInputDevice') as midi_input_device:
+            session._midi_port_names = None
+            session.update_midi_devices()
+            assert midi_input_device.call_count == 1
+
+            session._midi_port_names = None
+            session.update_midi_devices()
+            assert midi_input_device.call_count == 1
+            assert session.input_device_names == ['Keys']
+
+    def test_update_midi_devices_retries_ports_that_failed_to_open(self, mock_app):
+        """Test an input that failed to open is retried even if the available ports did not change."""
+        mock_app.global_timeline = iso.Timeline()
+        session = Session(mock_app)
+        keys = MagicMock()
+
+        with patch('isobar.get_midi_input_names', return_value=['Keys']), \
+                patch('isobar.get_midi_output_names', return_value=[]), \
+                patch('isobar.MidiInputDevice', side_effect=[OSError("port busy"), keys]) as midi_input_device:
+            session.update_midi_devices()
+            assert 'Keys' not in session.input_devices
+
+            session.update_midi_devices()
+            assert midi_input_device.call_count == 2
+            assert session.input_devices['Keys'] is keys
+
+            session.update_midi_devices()
+            assert midi_input_device.call_count == 2
+
+    def test_scan_midi_devices_does_not_modify_session(self, mock_app):
+        """Test scanning only opens new ports, the session is updated by apply_midi_devices."""
+        mock_app.global_timeline = iso.Timeline()
+        session = Session(mock_app)
+
+        with patch('isobar.get_midi_input_names', return_value=['Keys']), \
+                patch('isobar.get_midi_output_names', return_value=['Synth']):
+            result = session.scan_midi_devices()
+
+        input_names, output_names, opened_inputs, opened_outputs = result
+        assert input_names == ['Keys']
+        assert output_names == ['Synth']
+        assert list(opened_inputs) == ['Keys']
+        assert list(opened_outputs) == ['Synth']
+        assert session.input_devices == {}
+        assert session.output_devices == {}
+        assert 'Synth' not in session.output_device_names
+
+        session.apply_midi_devices(result)
+        assert session.input_devices['Keys'] is opened_inputs['Keys']
+        assert session.get_output_device('Synth') is opened_outputs['Synth']
+        assert 'Keys' in session.input_device_names
+        assert 'Synth' in session.output_device_names
+
+    def test_get_output_device_does_not_rescan(self, mock_app):
+        """Test looking up a missing output device never enumerates MIDI ports."""
+        mock_app.global_timeline = iso.Timeline()
+        session = Session(mock_app)
+
+        with patch('isobar.get_midi_output_names') as get_outputs:
+            assert session.get_output_device('Nonexistent') is None
+            get_outputs.assert_not_called()
+
     def test_timeline_start_stop(self, mock_app):
         """Test timeline start and stop."""
         mock_app.global_timeline = iso.Timeline()
@@ -1,5 +1,11 @@
 """Tests for utils.py module."""
 
+import json
+from unittest.mock import patch
+
+import numpy as np
+
+import utils
 from utils import (
     clamp,
     clamp01,
@@ -10,8 +16,11 @@ from utils import (
     draw_text_at,
     show_text,
     show_notification,
+    render_notification,
     draw_clip,
     draw_knob,
+    json_dumps,
+    json_loads,
 )
 
 
@@ -49,6 +58,30 @@ class TestClampFunctions:
         assert clamp01(1.0) == 1.0
 
 
+class TestJson:
+    """Test the settings JSON helpers, with and without orjson."""
+
+    SETTINGS = {
+        3: "int key",
+        "bpm": np.float32(120.5),
+        "steps": np.int64(16),
+        "pattern": np.array([1, 0, 1]),
+    }
+    EXPECTED = {"3": "int key", "bpm": 120.5, "steps": 16, "pattern": [1, 0, 1]}
+
+    def test_dumps_int_keys_and_numpy_values(self):
+        assert json.loads(json_dumps(self.SETTINGS)) == self.EXPECTED
+
+    def test_dumps_without_orjson(self):
+        with patch.object(utils, "orjson", None):
+            assert json.loads(json_dumps(self.SETTINGS)) == self.EXPECTED
+
+    def test_loads_round_trip(self):
+        assert json_loads(json_dumps(self.SETTINGS)) == self.EXPECTED
+        with patch.object(utils, "orjson", None):
+            assert json_loads(json_dumps(self.SETTINGS)) == self.EXPECTED
+
+
 class TestTextOverflow:
     """Test TextOverflow enum values."""
 
@@ -196,6 +229,14 @@ class TestShowNotification:
         """Test show_notification with custom opacity."""
         show_notification(mock_cairo_context, "Test", opacity=0.5)
 
+    def test_render_notification(self, mock_cairo_context):
+        """Test render_notification returns a surface that can be painted with alpha."""
+        surface = render_notification("Test")
+        assert surface.get_width() == 960
+        assert surface.get_height() == 160
+        mock_cairo_context.set_source_surface(surface, 0, 0)
+        mock_cairo_context.paint_with_alpha(0.5)
+
 
 class TestShowText:
     """Test show_text function."""
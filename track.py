@@ -35,7 +35,7 @@ class Track(BaseClass):
     @property
     def app(self):
         """Get the app instance through parent chain"""
-        return self._parent.app if hasattr(self._parent, 'app') else None
+        return getattr(self._parent, 'app', None)
 
     @app.setter
     def app(self, app):
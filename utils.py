@@ -1,14 +1,43 @@
 """Various utility functions and classes.
 """
+import json
 import math
 import time
 import cairo
 import push2_python
+from numpyencoder import NumpyEncoder
 
 import definitions
 
+# Use orjson for settings I/O when available, it is considerably faster than the stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 BEATS_PER_BAR = 4
 
+
+def json_loads(data):
+    """Parse a JSON document (e.g. the settings file), with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj):
+    """Serialize obj to a JSON string (e.g. for the settings file), with orjson when it is installed.
+    Non-string dict keys and numpy values are accepted with and without orjson"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            ).decode()
+        except TypeError:
+            pass  # Something orjson can't serialize, the stdlib json may still handle it
+    return json.dumps(obj, cls=NumpyEncoder)
+
+
 class ScaleGridList:
     def __init__(self, items, n_columns=6, n_rows=4):
         self.items = list(items)
@@ -180,7 +209,7 @@ def _get_marquee_text(ctx, text, font_size, max_width, cell_key):
         return text_str
 
     # Update marquee state
-    current_time = time.time()
+    current_time = time.monotonic()
 
     if cell_key not in MARQUEE_STATE:
         MARQUEE_STATE[cell_key] = {'offset': 0.0, 'last_update': current_time, 'paused': True}
@@ -433,6 +462,20 @@ def show_notification(ctx, text, opacity=1.0):
     ctx.restore()
 
 
+def render_notification(text):
+    """Render a fully opaque notification into its own surface. The surface can then be painted
+    every frame with ctx.set_source_surface() + ctx.paint_with_alpha(opacity) to fade it out,
+    without laying out the text again."""
+    surface = cairo.ImageSurface(
+        cairo.FORMAT_ARGB32,
+        push2_python.constants.DISPLAY_LINE_PIXELS,
+        push2_python.constants.DISPLAY_N_LINES,
+    )
+    show_notification(cairo.Context(surface), text)
+    surface.flush()
+    return surface
+
+
 def draw_clip(ctx, 
               clip,
               frame=(0.0, 0.0, 1.0, 1.0),  # (upper-left x, upper-left y, width, height)
@@ -472,7 +515,7 @@ def draw_clip(ctx,
         for step_idx in range(clip.steps):
             for voice in range(clip.max_polyphony):
                 note = clip.notes[step_idx, voice]
-                if note is not None:
+                if note != definitions.NO_NOTE:
                     duration = clip.durations[step_idx, voice] if step_idx < clip.steps else 0.25
                     # Calculate timing based on step position
                     start_time = step_idx * (clip.clip_length_in_beats / clip.steps)
@@ -603,7 +646,7 @@ class ScrollableList:
         self.list_start_y = list_start_y
         self.max_width_before_scroll = max_width_before_scroll
         self.pause_before_scroll = pause_before_scroll
-        self.last_scroll_time = time.time()
+        self.last_scroll_time = time.monotonic()
         self.scroll_text_offset = 0
         self.scroll_text_direction = 1
 
@@ -615,7 +658,7 @@ class ScrollableList:
         changed = (new_index != self.selected_index)
         self.selected_index = new_index
         if changed:
-            self.last_scroll_time = time.time()
+            self.last_scroll_time = time.monotonic()
         return changed
 
     def adjust_scroll_offset(self, visible_items):